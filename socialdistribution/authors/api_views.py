@@ -1,20 +1,67 @@
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.db.models.signals import post_save, post_delete
+
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes as drf_permission_classes
 from rest_framework.views import APIView
 from rest_framework.response import Response
+from socialdistribution.pagination import AuthorCursorPagination
 from socialdistribution.permissions import IsAuthenticatedNode, IsAuthenticatedNodeOrLocalUser, IsLocalUserOnly
-from socialdistribution.authentication import RemoteNodeBasicAuthentication  
-from django.urls import reverse
+from socialdistribution.authentication import RemoteNodeBasicAuthentication
+import orjson
 import requests
 from requests.auth import HTTPBasicAuth
+from authors.http_client import SESSION as REMOTE_SESSION
 from authors.models import Author, FollowRequest, FollowRequestStatus
 from authors.serializers import AuthorSerializer
 from django.conf import settings
-from urllib.parse import unquote, urlparse
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection, transaction
+from urllib.parse import unquote, urlparse, urlsplit
 from entries.models import RemoteNode
 from authors.serializers import AuthorSerializer, FollowAuthorRequestSerializer
 from drf_spectacular.utils import extend_schema
 
+# Shared pool for remote-node fan-out so worker threads aren't spawned
+# and torn down per request; sized to match the session connection pool.
+FANOUT_EXECUTOR = ThreadPoolExecutor(max_workers=32, thread_name_prefix="node-fanout")
+
+logger = logging.getLogger(__name__)
+
+# Process-local cache of active RemoteNodes keyed by URL netloc, so hot
+# paths don't pay a DB query plus an O(N) startswith scan per request.
+_NODE_CACHE_TTL = 60
+_node_cache = {"expires": 0.0, "by_netloc": {}}
+
+
+def _get_node_for_url(url):
+    """
+    Return the active RemoteNode whose base_url shares a host with the
+    given URL, or None if no node is configured for that host.
+    """
+    now = time.monotonic()
+    if now >= _node_cache["expires"]:
+        # netloc is parsed from base_url at save time, so the refresh is a
+        # straight column read with no per-node urlparse
+        _node_cache["by_netloc"] = {
+            node.netloc: node
+            for node in RemoteNode.objects.filter(is_active=True)
+        }
+        _node_cache["expires"] = now + _NODE_CACHE_TTL
+    return _node_cache["by_netloc"].get(urlparse(url).netloc)
+
+
+def _invalidate_node_cache(**kwargs):
+    _node_cache["expires"] = 0.0
+
+
+post_save.connect(_invalidate_node_cache, sender=RemoteNode)
+post_delete.connect(_invalidate_node_cache, sender=RemoteNode)
+
 
 class AuthorDetailView(generics.RetrieveAPIView):
     """
@@ -22,7 +69,9 @@ class AuthorDetailView(generics.RetrieveAPIView):
     Used to retrieve the author details and serialize them
     Accessible to both remote nodes and local users (public data)
     """
-    queryset = Author.objects.all()
+    # .only() keeps password hash, email, last_login etc. out of the row;
+    # the serializer reads just these columns.
+    queryset = Author.objects.only("id", "display_name", "github", "profile_image")
     serializer_class = AuthorSerializer
     # Add authentication for remote nodes
     permission_classes = [permissions.AllowAny]
@@ -30,11 +79,37 @@ class AuthorDetailView(generics.RetrieveAPIView):
     def retrieve(self, request, *args, **kwargs):
         # Log if accessed by remote node
         if hasattr(request.user, 'node'):
-            print(f"Remote node {request.user.node.name} accessing author detail")
+            logger.debug("Remote node %s accessing author detail", request.user.node.name)
         
         return super().retrieve(request, *args, **kwargs)
 
 
+def _site_root(request):
+    """Absolute site root ('https://host/') — compute once per request."""
+    return request.build_absolute_uri('/')
+
+
+def _author_values_to_api_dict(row, site_root):
+    """
+    Build the API author representation straight from a .values() row,
+    skipping model instantiation and per-field serializer machinery.
+    URLs are plain f-strings on a precomputed site root so the hot loop
+    never re-runs reverse()/build_absolute_uri() per row; the paths must
+    stay in sync with authors/api_urls.py and authors/urls.py, and the
+    shape with AuthorSerializer's output.
+    """
+    author_id = row["id"]
+    return {
+        "type": "author",
+        "id": f"{site_root}api/authors/{author_id}/",
+        "host": f"{site_root}api/",
+        "displayName": row["display_name"],
+        "github": row["github"],
+        "profileImage": row["profile_image"],
+        "web": f"{site_root}authors/profile/{author_id}/",
+    }
+
+
 class AuthorListView(generics.ListAPIView):
     """
     GET /api/authors/
@@ -42,24 +117,68 @@ class AuthorListView(generics.ListAPIView):
     Accessible to both remote nodes and local users
     """
     serializer_class = AuthorSerializer
-   
+
     authentication_classes = [RemoteNodeBasicAuthentication]
-    permission_classes = [IsAuthenticatedNodeOrLocalUser]  
-    pagination_class = None  # Disable pagination for simplicity
+    permission_classes = [IsAuthenticatedNodeOrLocalUser]
+    # Keyset pagination: each page is an indexed range scan on id
+    pagination_class = AuthorCursorPagination
+
+    # Serialized author dicts rarely change; updated_at in the key handles
+    # invalidation, the TTL just bounds cache growth.
+    AUTHOR_CACHE_TTL = 3600
+
     def get_queryset(self):
+        # The list path narrows further via .values(); .only() covers any
+        # other consumer of this queryset.
         return Author.objects.filter(
             is_active=True,
             is_approved=True,
+        ).only(
+            "id", "display_name", "github", "profile_image", "updated_at"
         ).order_by("id")
 
     def list(self, request, *args, **kwargs):
         # Log if accessed by remote node
         if hasattr(request.user, 'node'):
-            print(f"Remote node {request.user.node.name} accessing authors list")
-        
-        queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
-        authors = serializer.data
+            logger.debug("Remote node %s accessing authors list", request.user.node.name)
+
+        # Hot path: stream narrow .values() rows and build the response
+        # dicts directly instead of paying serializer overhead per row.
+        values_qs = self.get_queryset().values(
+            "id", "display_name", "github", "profile_image", "updated_at"
+        )
+
+        page = self.paginate_queryset(values_qs)
+        if page is not None:
+            rows = page
+        else:
+            rows = list(values_qs.iterator(chunk_size=2000))
+
+        # Serialized dicts are cached per author, keyed on updated_at so a
+        # profile edit naturally invalidates its entry; one get_many covers
+        # the whole page and only misses are rebuilt. The site root is part
+        # of the key because the cached dicts embed absolute URLs — with a
+        # shared backend (Redis) one host's URLs must not leak to another.
+        site_root = _site_root(request)
+        keys = [
+            f"author:{row['id']}:{row['updated_at'].timestamp()}:{site_root}"
+            for row in rows
+        ]
+        cached = cache.get_many(keys)
+        authors = []
+        fresh = {}
+        for key, row in zip(keys, rows):
+            data = cached.get(key)
+            if data is None:
+                data = _author_values_to_api_dict(row, site_root)
+                fresh[key] = data
+            authors.append(data)
+
+        if fresh:
+            cache.set_many(fresh, self.AUTHOR_CACHE_TTL)
+
+        if page is not None:
+            return self.paginator.get_paginated_response(authors)
 
         # Spec-compliant shape
         return Response({
@@ -75,91 +194,231 @@ class ExploreAuthorsView(APIView):
     """
     # Only local users should access this endpoint
     permission_classes = [IsLocalUserOnly]
-    
-    def get(self, request):
-        from entries.models import RemoteNode
-        
-        # Get local authors using existing queryset logic
-        local_authors = Author.objects.filter(
-            is_active=True,
-            is_approved=True,
-        ).exclude(id=request.user.id).order_by("id")
-        local_serializer = AuthorSerializer(local_authors, many=True, context={'request': request})
-        
-        # Get remote authors from all connected nodes
-        remote_authors = []
-        connected_nodes = RemoteNode.objects.filter(is_active=True)
-        
-        for node in connected_nodes:
-            try:
-                node_base = node.base_url.rstrip('/')
 
-                response = requests.get(
-                    f"{node_base}/api/authors/",
+    # How long a successful node fetch is served from cache before re-fetching
+    NODE_CACHE_TTL = 30
+    # How long a stale copy is kept around to serve when the node is down
+    NODE_STALE_TTL = 60 * 60 * 24
+
+    # Merged remote-author snapshot, refreshed by the refresh_explore_snapshot
+    # cron job so the view normally never fans out on the request thread.
+    # TTL outlives the cron interval so a slightly late tick doesn't miss.
+    SNAPSHOT_KEY = "explore:snapshot"
+    SNAPSHOT_TTL = 90
+
+    # Upper bound on cursor pages followed per node (100 authors each), so
+    # a misbehaving peer can't keep us walking "next" links forever.
+    MAX_NODE_PAGES = 20
+
+    @classmethod
+    def _fetch_node_authors(cls, node):
+        """
+        Fetch and filter the author list from a single remote node.
+
+        Successful results are cached for a short TTL so repeated explore
+        requests don't re-hit every node, and kept under a long-TTL stale
+        key that is served if the node is down or misbehaving — so one bad
+        node never breaks the whole explore page.
+        """
+        cache_key = f"explore:node:{node.id}"
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            node_base = node.base_url.rstrip('/')
+
+            # Send cached ETag/Last-Modified validators so unchanged nodes
+            # can answer 304 with an empty body instead of the full list.
+            headers = {}
+            validators = cache.get(f"{cache_key}:validators") or {}
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+
+            # Our own /api/authors/ is cursor-paginated at 100 per page, so
+            # peers running this codebase expose a "next" link; walk it (up
+            # to MAX_NODE_PAGES) so large nodes aren't silently truncated.
+            # Unpaginated peers return no "next" and exit after one page.
+            authors = []
+            first_response = None
+            next_url = f"{node_base}/api/authors/"
+            pages = 0
+            while next_url and pages < cls.MAX_NODE_PAGES:
+                response = REMOTE_SESSION.get(
+                    next_url,
                     auth=HTTPBasicAuth(node.username, node.password),
+                    headers=headers,
                     timeout=5
                 )
-                
+                # The cached validators describe the first page only
+                headers = {}
+
+                if first_response is None:
+                    first_response = response
+                    if response.status_code == 304:
+                        # Not modified: the stale copy is still current,
+                        # re-arm the short-TTL key so the next requests
+                        # skip the HTTP call too.
+                        stale = cache.get(f"{cache_key}:stale", [])
+                        cache.set(cache_key, stale, cls.NODE_CACHE_TTL)
+                        return stale
+
                 if not response.ok:
+                    return cache.get(f"{cache_key}:stale", [])
+
+                data = orjson.loads(response.content)
+                authors.extend(data.get('authors', []))
+                next_url = data.get('next')
+                if next_url and not next_url.startswith(f"{node_base}/"):
+                    # Never chase a link that would send this node's
+                    # credentials to a different origin
+                    break
+                pages += 1
+
+            filtered_authors = []
+            for author in authors:
+                # Try host first (ActivityPub spec-style), then fall back to id/url
+                host = (author.get('host') or '').rstrip('/')
+                author_id = (author.get('id') or author.get('url') or '').rstrip('/')
+
+                # Decide if this author is "local" to that node:
+                # 1. If host is present, use it
+                # 2. Otherwise, fall back to id/url
+                source_url = host or author_id
+                if not source_url:
+                    continue  # can't determine, skip
+
+                # Compare by scheme+netloc (so https://test.com and https://test.com/api/... match)
+                parsed_node = urlparse(node_base)
+                parsed_source = urlparse(source_url)
+
+                same_origin = (
+                    parsed_node.scheme == parsed_source.scheme and
+                    parsed_node.netloc == parsed_source.netloc
+                )
+                if not same_origin:
+                    # This is a "remote of a remote" – skip it
                     continue
 
-                data = response.json()
-                authors = data.get('authors', [])
-
-                filtered_authors = []
-                for author in authors:
-                    # Try host first (ActivityPub spec-style), then fall back to id/url
-                    host = (author.get('host') or '').rstrip('/')
-                    author_id = (author.get('id') or author.get('url') or '').rstrip('/')
-
-                    # Decide if this author is "local" to that node:
-                    # 1. If host is present, use it
-                    # 2. Otherwise, fall back to id/url
-                    source_url = host or author_id
-                    if not source_url:
-                        continue  # can't determine, skip
-
-                    # Compare by scheme+netloc (so https://test.com and https://test.com/api/... match)
-                    parsed_node = urlparse(node_base)
-                    parsed_source = urlparse(source_url)
-
-                    same_origin = (
-                        parsed_node.scheme == parsed_source.scheme and
-                        parsed_node.netloc == parsed_source.netloc
+                # At this point we've confirmed the author belongs to this node
+                author['_node_name'] = node.name
+                author['_is_remote'] = True
+
+                # Ensure username exists - extract from displayName if missing
+                if not author.get('username'):
+                    display_name = (
+                        author.get('displayName')
+                        or author.get('display_name')
+                        or 'unknown'
                     )
-                    if not same_origin:
-                        # This is a "remote of a remote" – skip it
-                        continue
-
-                    # At this point we've confirmed the author belongs to this node
-                    author['_node_name'] = node.name
-                    author['_is_remote'] = True
-
-                    # Ensure username exists - extract from displayName if missing
-                    if not author.get('username'):
-                        display_name = (
-                            author.get('displayName')
-                            or author.get('display_name')
-                            or 'unknown'
-                        )
-                        author['username'] = display_name.lower().replace(' ', '_')
-
-                    filtered_authors.append(author)
-
-                remote_authors.extend(filtered_authors)
-
-            except Exception as e:
-                # Log but don't fail if one node is down or misbehaving
-                print(f"Error fetching from {node.name}: {str(e)}")
-                continue
-        
+                    author['username'] = display_name.lower().replace(' ', '_')
+
+                filtered_authors.append(author)
+
+            cache.set(cache_key, filtered_authors, cls.NODE_CACHE_TTL)
+            cache.set(f"{cache_key}:stale", filtered_authors, cls.NODE_STALE_TTL)
+            cache.set(
+                f"{cache_key}:validators",
+                {
+                    "etag": first_response.headers.get("ETag"),
+                    "last_modified": first_response.headers.get("Last-Modified"),
+                },
+                cls.NODE_STALE_TTL,
+            )
+            return filtered_authors
+
+        except Exception as e:
+            # Log (lazily, stack trace only at DEBUG) but don't fail if one
+            # node is down or misbehaving
+            logger.warning(
+                "Error fetching from %s: %s", node.name, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return cache.get(f"{cache_key}:stale", [])
+
+    @classmethod
+    def refresh_snapshot(cls):
+        """
+        Fan out to every active node, merge the results and store them as
+        one snapshot. Run periodically from cron so explore requests read a
+        precomputed row instead of paying the fan-out themselves; also used
+        as the in-request fallback when the snapshot has expired.
+        """
+        from entries.models import RemoteNode
+
+        remote_authors = []
+        connected_nodes = list(RemoteNode.objects.filter(is_active=True))
+
+        if connected_nodes:
+            futures = [
+                FANOUT_EXECUTOR.submit(cls._fetch_node_authors, node)
+                for node in connected_nodes
+            ]
+            for future in as_completed(futures):
+                remote_authors.extend(future.result())
+
+        cache.set(cls.SNAPSHOT_KEY, {"remote": remote_authors}, cls.SNAPSHOT_TTL)
+        return remote_authors
+
+    def get(self, request):
+        # Get local authors using existing queryset logic; use the same
+        # .values() dict pipeline as AuthorListView so the list path never
+        # drops into per-object serializer construction.
+        local_rows = Author.objects.filter(
+            is_active=True,
+            is_approved=True,
+        ).exclude(id=request.user.id).order_by("id").values(
+            "id", "display_name", "github", "profile_image"
+        )
+        # .iterator() streams rows from the DB cursor instead of caching the
+        # whole result set on the queryset, capping memory on large tables.
+        site_root = _site_root(request)
+        local_data = [
+            _author_values_to_api_dict(row, site_root)
+            for row in local_rows.iterator(chunk_size=500)
+        ]
+
+        # Remote authors come from the cron-maintained snapshot; the fan-out
+        # only runs on the request thread if the snapshot has lapsed (cold
+        # start, cron down), and that refresh re-primes it for everyone.
+        snapshot = cache.get(self.SNAPSHOT_KEY)
+        if snapshot is not None:
+            remote_authors = snapshot["remote"]
+        else:
+            remote_authors = self.refresh_snapshot()
+
         return Response({
             'type': 'authors',
-            'local': local_serializer.data,
+            'local': local_data,
             'remote': remote_authors,
-            'all': local_serializer.data + remote_authors
+            'all': local_data + remote_authors
         })
 
+def _upsert_local_follow_request(follower, followee_id):
+    """
+    Upsert a PENDING FollowRequest for a local followee inside one
+    transaction. On backends with row locking (Postgres) the followee row
+    is locked first, so concurrent double-clicks serialize on that lock
+    instead of racing the unique index into an IntegrityError. SQLite has
+    no FOR UPDATE; there the followee FK constraint still validates the id.
+
+    Raises Author.DoesNotExist, IntegrityError, ValidationError or
+    ValueError when the followee id is malformed or unknown.
+    """
+    with transaction.atomic():
+        if connection.features.has_select_for_update:
+            followee_id = Author.objects.select_for_update().values_list(
+                "id", flat=True
+            ).get(id=followee_id)
+        return FollowRequest.objects.get_or_create(
+            follower=follower,
+            followee_id=followee_id,
+            defaults={'status': FollowRequestStatus.PENDING},
+        )
+
+
 @extend_schema(
     request=FollowAuthorRequestSerializer,
     responses={
@@ -188,71 +447,64 @@ def api_follow_author(request):
             status=status.HTTP_400_BAD_REQUEST
         )
     
-    # Check if it's a local follow (just the UUID) or remote (full URL)
-    current_host = request.build_absolute_uri('/').rstrip('/')
+    # Check if it's a local follow (just the UUID) or remote (full URL);
+    # one build_absolute_uri call covers every URL built below.
+    site_root = _site_root(request)
+    current_host = site_root.rstrip('/')
     
     # Handle if they sent just a UUID
     if not target_author_url.startswith('http'):
-        # Local author by UUID
+        # Local author by UUID: single transactional upsert
         try:
-            target_author = Author.objects.get(id=target_author_url)
-            
-            follow_req, created = FollowRequest.objects.get_or_create(
-                follower=request.user,
-                followee=target_author,
-                defaults={'status': FollowRequestStatus.PENDING}
+            follow_req, created = _upsert_local_follow_request(
+                request.user, target_author_url
             )
-            print(f"[FOLLOW] Using auth - username: {remote_node.username}, password: {remote_node.password}")
-            print(f"[FOLLOW] Remote node: {remote_node.name} at {remote_node.base_url}")
-            return Response({
-                'detail': 'Follow request sent',
-                'created': created
-            }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
-        
-        except Author.DoesNotExist:
+        except (Author.DoesNotExist, IntegrityError, ValidationError, ValueError):
             return Response(
                 {'detail': 'Author not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
-    
-    # It's a full URL - check if local or remote
-    if target_author_url.startswith(current_host):
-        # LOCAL but with full URL
+
+        return Response({
+            'detail': 'Follow request sent',
+            'created': created
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
+    # It's a full URL - parse once and branch on the host instead of
+    # re-scanning the string with startswith for every candidate prefix.
+    target_host = urlsplit(target_author_url).netloc
+    if target_host == urlsplit(current_host).netloc:
+        # LOCAL but with full URL: same single-upsert path as the UUID case
         try:
             target_author_id = target_author_url.split('/')[-1]
-            target_author = Author.objects.get(id=target_author_id)
-            
-            follow_req, created = FollowRequest.objects.get_or_create(
-                follower=request.user,
-                followee=target_author,
-                defaults={'status': FollowRequestStatus.PENDING}
+            follow_req, created = _upsert_local_follow_request(
+                request.user, target_author_id
             )
-            
-            return Response({
-                'detail': 'Follow request sent (local)',
-                'created': created
-            }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
-        
-        except Author.DoesNotExist:
+        except (Author.DoesNotExist, IntegrityError, ValidationError, ValueError):
             return Response(
                 {'detail': 'Author not found'},
                 status=status.HTTP_404_NOT_FOUND
             )
-    
+
+        return Response({
+            'detail': 'Follow request sent (local)',
+            'created': created
+        }, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
+
     else:
         # REMOTE AUTHOR - send to their inbox
         from entries.models import RemoteNode
         
-        print(f"[FOLLOW] Following remote author: {target_author_url}")
+        logger.debug("[FOLLOW] Following remote author: %s", target_author_url)
         
         # Build current user's author URL
-        current_user_url = request.build_absolute_uri(f'/api/authors/{request.user.id}/')
-        
+        current_user_url = f"{site_root}api/authors/{request.user.id}/"
+
         actor_data = {
             'type': 'author',
             'id': current_user_url,
             'displayName': getattr(request.user, 'display_name', None) or request.user.username,
-            'host': request.build_absolute_uri('/api/'),
+            'host': f"{site_root}api/",
             'github': getattr(request.user, 'github', ''),
             'profileImage': getattr(request.user, 'profile_image', ''),
         }
@@ -270,67 +522,65 @@ def api_follow_author(request):
         # Find the remote node
         inbox_url = f"{target_author_url}/inbox/"
         
-        remote_node = None
-        for node in RemoteNode.objects.filter(is_active=True):
-            if target_author_url.startswith(node.base_url.rstrip('/')):
-                remote_node = node
-                break
-        
+        remote_node = _get_node_for_url(target_author_url)
+
         if not remote_node:
-            print(f"[FOLLOW] No remote node configured for {target_author_url}")
+            logger.warning("[FOLLOW] No remote node configured for %s", target_author_url)
             return Response(
                 {'detail': 'Remote node not configured'},
                 status=status.HTTP_400_BAD_REQUEST
             )
         
+        # Extract UUID from the remote author URL up front so we don't pay
+        # for the network round trips on obviously malformed input.
         try:
-            
-            auth = HTTPBasicAuth(remote_node.username, remote_node.password)
-            print(f"[FOLLOW] Using auth - username: {remote_node.username}, password: {remote_node.password}")
-            print(f"[FOLLOW] Remote node: {remote_node.name} at {remote_node.base_url}")
-            print(f"[FOLLOW] POSTing to {inbox_url}")
-            print(f"[FOLLOW] Payload: {follow_request_data}")
-            response = requests.post(
+            remote_uuid = target_author_url.split('/')[-1]
+            import uuid as uuid_module
+            uuid_module.UUID(remote_uuid)
+        except (ValueError, IndexError):
+            return Response({
+                'detail': 'Invalid remote author UUID',
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        auth = HTTPBasicAuth(remote_node.username, remote_node.password)
+
+        def fetch_author_info():
+            """Best-effort profile fetch; empty dict if the node won't say."""
+            try:
+                author_response = REMOTE_SESSION.get(
+                    target_author_url,
+                    auth=auth,
+                    timeout=5
+                )
+                if author_response.ok:
+                    return author_response.json()
+            except requests.RequestException as e:
+                logger.warning("[FOLLOW] Error fetching author info: %s", e)
+            return {}
+
+        try:
+            # Overlap the profile fetch with the inbox POST so the critical
+            # path costs one round trip to the remote host, not two in series.
+            author_info_future = FANOUT_EXECUTOR.submit(fetch_author_info)
+
+            logger.debug("[FOLLOW] POSTing to %s", inbox_url)
+            response = REMOTE_SESSION.post(
                 inbox_url,
                 json=follow_request_data,
                 auth=auth,
                 timeout=10
             )
-            
-            print(f"[FOLLOW] Response: {response.status_code} - {response.text[:200]}")
+
+            logger.debug(
+                "[FOLLOW] Response: %s - %s", response.status_code, response.text[:200]
+            )
 
             if response.ok:
-                # Extract UUID from the remote author URL
-                try:
-                    remote_uuid = target_author_url.split('/')[-1]
-                    import uuid as uuid_module
-                    uuid_module.UUID(remote_uuid)
-                except (ValueError, IndexError):
-                    return Response({
-                        'detail': 'Invalid remote author UUID',
-                    }, status=status.HTTP_400_BAD_REQUEST)
-                
-                try:
-                    author_response = requests.get(
-                        target_author_url,
-                        auth=HTTPBasicAuth(remote_node.username, remote_node.password),
-                        timeout=5
-                    )
-                    if author_response.ok:
-                        author_info = author_response.json()
-                        display_name = author_info.get('displayName', 'Remote Author')
-                        github = author_info.get('github', '')
-                        profile_image = author_info.get('profileImage', '')
-                    else:
-                        display_name = 'Remote Author'
-                        github = ''
-                        profile_image = ''
-                except Exception as e:
-                    print(f"[FOLLOW] Error fetching author info: {e}")
-                    display_name = 'Remote Author'
-                    github = ''
-                    profile_image = ''
-    
+                author_info = author_info_future.result()
+                display_name = author_info.get('displayName', 'Remote Author')
+                github = author_info.get('github', '')
+                profile_image = author_info.get('profileImage', '')
+
                 # Store the remote author locally
                 remote_author, _ = Author.objects.get_or_create(
                     id=remote_uuid,
@@ -367,8 +617,10 @@ def api_follow_author(request):
                 }, status=status.HTTP_502_BAD_GATEWAY)
         
         except requests.exceptions.RequestException as e:
-            import traceback
-            traceback.print_exc()
+            logger.warning(
+                "[FOLLOW] Connection error posting to %s: %s", inbox_url, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             return Response({
                 'detail': f'Connection error: {str(e)}'
             }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
@@ -470,10 +722,17 @@ def followers_list_api(request, author_id):
     if str(request.user.id) != str(author_id):
         return Response(status=status.HTTP_403_FORBIDDEN)
 
+    # select_related keeps this at one query regardless of follower count;
+    # .only() trims the joined SELECT to the columns the serializer reads.
     follow_qs = FollowRequest.objects.filter(
         followee=local_author,
         status=FollowRequestStatus.APPROVED,
-    ).select_related("follower")
+    ).select_related("follower").only(
+        "follower__id",
+        "follower__display_name",
+        "follower__github",
+        "follower__profile_image",
+    )
 
     followers = [fr.follower for fr in follow_qs]
     data = AuthorSerializer(followers, many=True, context={'request': request}).data
@@ -538,14 +797,10 @@ def followers_detail_api(request, author_id, foreign_author_fqid):
         github = ''
         profile_image = ''
         try:
-            remote_node = None
-            for node in RemoteNode.objects.filter(is_active=True):
-                if foreign_fqid.startswith(node.base_url.rstrip('/')):
-                    remote_node = node
-                    break
+            remote_node = _get_node_for_url(foreign_fqid)
 
             if remote_node:
-                resp = requests.get(
+                resp = REMOTE_SESSION.get(
                     foreign_fqid,
                     auth=HTTPBasicAuth(remote_node.username, remote_node.password),
                     timeout=5,
@@ -556,7 +811,7 @@ def followers_detail_api(request, author_id, foreign_author_fqid):
                     github = info.get('github', github)
                     profile_image = info.get('profileImage', profile_image)
         except Exception as e:
-            print(f"[FOLLOWERS API] error fetching remote author info: {e}")
+            logger.warning("[FOLLOWERS API] error fetching remote author info: %s", e)
 
         # Derive host from FQID up to /api/
         host = None
@@ -0,0 +1,27 @@
+"""
+Shared HTTP session for outbound node-to-node calls.
+
+Module-level so every caller reuses the same pooled TCP/TLS connections
+instead of paying DNS resolution and a fresh handshake per request.
+Transient upstream errors (502/503/504) are retried with backoff for
+idempotent methods; POSTs to remote inboxes are deliberately not
+retried on status to avoid duplicate deliveries.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+SESSION = requests.Session()
+SESSION.headers["User-Agent"] = "socialdistribution-node/1.0"
+
+_adapter = HTTPAdapter(
+    pool_connections=64,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+    ),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
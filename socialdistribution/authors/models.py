@@ -19,7 +19,10 @@ class Author(AbstractUser):
     # Admin approval for sign-ups
     is_approved = models.BooleanField(default=False, help_text="Admin has approved this user")
     host = models.URLField(blank=True, null=True)
-    
+
+    # Bumped on every save; used to key per-author caches
+    updated_at = models.DateTimeField(auto_now=True)
+
     # URL to author's profile - remains unique across the app
     def get_absolute_url(self):
         return reverse("authors:profile_detail", args=[self.id])
@@ -1,112 +1,179 @@
 from django.test import TestCase
 from django.urls import reverse
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 from authors.models import Author  
 from entries.models import Entry, Visibility, RemoteNode
 import uuid
 import base64
 from unittest.mock import patch
-from entries.github_sync import fetch_github_activity
+from entries.github_sync import create_github_entries_for_author
+
+# 1x1 PNG data URI shared by the image-entry tests and fixtures
+TINY_PNG_B64 = (
+    "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUA"
+    "AAAABCAIAAACQd1PeAAAAEElEQVR42mP8/5+hPAAHggJ/P9ZqAAAAAElFTkSuQmCC"
+)
 
 
 class AuthorAndEntryURLTests(APITestCase):   
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """
         Set up test data for authors and entries.
-        """
-        Entry.objects.all().delete()  # Clear all entries
-        Author.objects.all().delete()  # Clear all authors
-        
-        self.author = Author.objects.create(
-            id=uuid.uuid4(),
-            username="test_author",
-            display_name="test_author",
-            password='123',
-            github="https://github.com/test_author",
-            profile_image="https://example.com/profile_image.png",
-            is_approved=True
-        )
-        self.author2 = Author.objects.create(
-            id=uuid.uuid4(),
-            username="test_author2",
-            display_name="test_author2",
-            password='123',
-            github="https://github.com/author2",
-            profile_image="https://example.com/author2.png",
-            is_approved=True
-        )
-        self.author3 = Author.objects.create(
-            id=uuid.uuid4(),
-            username="test_author3",
-            display_name="test_author3",
-            password='123',
-            github="https://github.com/author3",
-            profile_image="https://example.com/author3.png",
-            is_approved=True
-        )
-        
-        # Create a remote node for testing Basic Auth
-        self.remote_node = RemoteNode.objects.create(
-            name="Test Node",
-            base_url="https://test.example.com/api/",
-            username="test_node",
-            password="test_pass",
-            is_active=True
-        )
-        
-        self.entry = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Test Entry",
-            description="This is a brief description of the entry.",
-            content="This is a test entry.",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
-        self.entry2 = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Test Entry",
-            description="This is a brief description of the entry.",
-            content="This is a test entry.",
-            author=self.author,
-            visibility=Visibility.FRIENDS,
-        )
-        self.markdown_entry_with_image = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Markdown Entry with Image",
-            description="This is a test entry with Markdown linking to an image.",
-            content="![Alt text](https://example.com/image.png)",  # Markdown syntax for an image
-            content_type="text/markdown",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
-        # Public entry by self.author2
-        self.public_entry_author2 = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Public Entry by Author2",
-            description="This is a public entry by author2.",
-            content="This is a public entry.",
-            author=self.author2,
-            visibility=Visibility.PUBLIC,
-        )
-        # Friends-only entry by self.author2
-        self.friends_entry_author2 = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Friends Entry by Author2",
-            description="This is a friends-only entry by author2.",
-            content="This is a friends-only entry.",
-            author=self.author2,
-            visibility=Visibility.FRIENDS,
-        )
-        # Public entry by self.author3
-        self.public_entry_author3 = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Public Entry by Author3",
-            description="This is a public entry by author3.",
-            content="This is a public entry.",
-            author=self.author3,
-            visibility=Visibility.PUBLIC,
-        )
+
+        Created once per class instead of once per test (setUpTestData);
+        each test runs in a rolled-back transaction, so per-test cleanup
+        and re-creation of these rows is unnecessary.
+        """
+        # Single multi-row INSERT per model instead of one round trip per
+        # .create(); ids are pre-assigned UUIDs so bulk_create is safe here.
+        cls.author, cls.author2, cls.author3 = Author.objects.bulk_create([
+            Author(
+                id=uuid.uuid4(),
+                username="test_author",
+                display_name="test_author",
+                password='123',
+                github="https://github.com/test_author",
+                profile_image="https://example.com/profile_image.png",
+                is_approved=True
+            ),
+            Author(
+                id=uuid.uuid4(),
+                username="test_author2",
+                display_name="test_author2",
+                password='123',
+                github="https://github.com/author2",
+                profile_image="https://example.com/author2.png",
+                is_approved=True
+            ),
+            Author(
+                id=uuid.uuid4(),
+                username="test_author3",
+                display_name="test_author3",
+                password='123',
+                github="https://github.com/author3",
+                profile_image="https://example.com/author3.png",
+                is_approved=True
+            ),
+        ])
+
+        # One pre-authenticated client for the whole class: force_authenticate
+        # sets the user directly, skipping per-test session creation/writes
+        cls.auth_client = APIClient()
+        cls.auth_client.force_authenticate(user=cls.author)
+
+        # The node credentials never change, so encode the header once
+        cls.NODE_AUTH_HEADER = "Basic " + base64.b64encode(b"test_node:test_pass").decode()
+
+        (
+            cls.entry,
+            cls.entry2,
+            cls.markdown_entry_with_image,
+            cls.public_entry_author2,
+            cls.friends_entry_author2,
+            cls.public_entry_author3,
+        ) = Entry.objects.bulk_create([
+            Entry(
+                id=uuid.uuid4(),
+                title="Test Entry",
+                description="This is a brief description of the entry.",
+                content="This is a test entry.",
+                author=cls.author,
+                visibility=Visibility.PUBLIC,
+            ),
+            Entry(
+                id=uuid.uuid4(),
+                title="Test Entry",
+                description="This is a brief description of the entry.",
+                content="This is a test entry.",
+                author=cls.author,
+                visibility=Visibility.FRIENDS,
+            ),
+            Entry(
+                id=uuid.uuid4(),
+                title="Markdown Entry with Image",
+                description="This is a test entry with Markdown linking to an image.",
+                content="![Alt text](https://example.com/image.png)",  # Markdown syntax for an image
+                content_type="text/markdown",
+                author=cls.author,
+                visibility=Visibility.PUBLIC,
+            ),
+            # Public entry by cls.author2
+            Entry(
+                id=uuid.uuid4(),
+                title="Public Entry by Author2",
+                description="This is a public entry by author2.",
+                content="This is a public entry.",
+                author=cls.author2,
+                visibility=Visibility.PUBLIC,
+            ),
+            # Friends-only entry by cls.author2
+            Entry(
+                id=uuid.uuid4(),
+                title="Friends Entry by Author2",
+                description="This is a friends-only entry by author2.",
+                content="This is a friends-only entry.",
+                author=cls.author2,
+                visibility=Visibility.FRIENDS,
+            ),
+            # Public entry by cls.author3
+            Entry(
+                id=uuid.uuid4(),
+                title="Public Entry by Author3",
+                description="This is a public entry by author3.",
+                content="This is a public entry.",
+                author=cls.author3,
+                visibility=Visibility.PUBLIC,
+            ),
+        ])
+
+        # Shared by the retrieve/render/visibility tests, which only read
+        (
+            cls.markdown_entry,
+            cls.image_entry_public,
+            cls.image_entry_friends,
+        ) = Entry.objects.bulk_create([
+            Entry(
+                id=uuid.uuid4(),
+                title="Markdown Entry",
+                description="This is a test entry with Markdown",
+                content="# Hello World\nThis is **bold** text.",
+                content_type="text/markdown",
+                author=cls.author,
+                visibility=Visibility.PUBLIC,
+            ),
+            Entry(
+                id=uuid.uuid4(),
+                title="Image Entry",
+                description="This is a test entry with an image.",
+                content=TINY_PNG_B64,
+                content_type="image/png;base64",
+                author=cls.author,
+                visibility=Visibility.PUBLIC,
+            ),
+            Entry(
+                id=uuid.uuid4(),
+                title="Friends Image Entry",
+                description="This is a friends-only image entry.",
+                content=TINY_PNG_B64,
+                content_type="image/png;base64",
+                author=cls.author,
+                visibility=Visibility.FRIENDS,
+            ),
+        ])
+
+        # Absolute author URLs as the API is expected to emit them — this
+        # f-string shape is the public contract the tests assert against
+        cls.author_api_url = f"http://testserver/api/authors/{cls.author.id}/"
+        cls.author2_api_url = f"http://testserver/api/authors/{cls.author2.id}/"
+
+        # URLs the tests hit repeatedly, resolved once per class; reverse()
+        # walks the resolver tree on every call
+        cls.author_detail_url = reverse("authors_api:author-detail", kwargs={"pk": cls.author.id})
+        cls.author_list_url = reverse("authors_api:authors-list")
+        cls.entry_detail_url = reverse("api:entry-detail", kwargs={"entry_id": cls.entry.id})
+        cls.profile_url = reverse("authors:profile_detail", kwargs={"author_id": cls.author.id})
     
     def get_basic_auth_header(self, username, password):
         """Helper method to create Basic Auth header"""
@@ -118,40 +185,44 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that the author's API URL is consistent and predictable.
         """
-        # Generate the API URL for the author
-        author_url = reverse("authors_api:author-detail", kwargs={"pk": self.author.id})
+        # API URL for the author, resolved once in setUpTestData
+        author_url = self.author_detail_url
         response = self.client.get(author_url)
 
         # Assert the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Assert the JSON response contains the correct author details
-        self.assertEqual(response.json()["id"], f"http://testserver{author_url}")
-        self.assertEqual(response.json()["displayName"], self.author.display_name)
-        self.assertEqual(response.json()["github"], self.author.github)
-        self.assertEqual(response.json()["profileImage"], self.author.profile_image)
-        self.assertEqual(response.json()["host"], "http://testserver/api/")
-        self.assertEqual(response.json()["web"], f"http://testserver/authors/profile/{self.author.id}/")
+        # Assert the response contains the correct author details;
+        # response.data reads the pre-render dict, skipping a JSON
+        # serialize/parse round trip
+        data = response.data
+        self.assertEqual(data["id"], f"http://testserver{author_url}")
+        self.assertEqual(data["displayName"], self.author.display_name)
+        self.assertEqual(data["github"], self.author.github)
+        self.assertEqual(data["profileImage"], self.author.profile_image)
+        self.assertEqual(data["host"], "http://testserver/api/")
+        self.assertEqual(data["web"], f"http://testserver/authors/profile/{self.author.id}/")
 
     def test_entry_url_consistency(self): #Identity 1
         """
         Test that the entry's API URL is consistent and predictable.
         """
-        entry_url = reverse("api:entry-detail", kwargs={"entry_id": self.entry.id})
+        entry_url = self.entry_detail_url
         response = self.client.get(entry_url)
 
         # Assert the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Assert the JSON response contains the correct entry details
-        self.assertEqual(response.json()["id"], f"http://testserver{entry_url}")
-        self.assertEqual(response.json()["title"], self.entry.title)
-        self.assertEqual(response.json()["description"], self.entry.description)
-        self.assertEqual(response.json()["content"], self.entry.content)
+        # Assert the response contains the correct entry details
+        data = response.data
+        self.assertEqual(data["id"], f"http://testserver{entry_url}")
+        self.assertEqual(data["title"], self.entry.title)
+        self.assertEqual(data["description"], self.entry.description)
+        self.assertEqual(data["content"], self.entry.content)
 
         # Assert the nested author object
-        author_data = response.json()["author"]
-        self.assertEqual(author_data["id"], f"http://testserver/api/authors/{self.author.id}/")
+        author_data = data["author"]
+        self.assertEqual(author_data["id"], self.author_api_url)
         self.assertEqual(author_data["displayName"], self.author.display_name)
         self.assertEqual(author_data["github"], self.author.github)
         self.assertEqual(author_data["profileImage"], self.author.profile_image)
@@ -161,85 +232,95 @@ class AuthorAndEntryURLTests(APITestCase):
         Test that the API returns a list of all authors hosted on the node.
         Requires authentication (local user).
         """
-        # Authenticate as a local user before accessing the endpoint
-        self.client.force_authenticate(user=self.author)
-        
-        author_list_url = reverse("authors_api:authors-list")
-        response = self.client.get(author_list_url)
+        # Pre-authenticated client from setUpTestData
+        author_list_url = self.author_list_url
+        # One indexed scan regardless of author count; guards against a
+        # serializer change quietly reintroducing per-row queries
+        with self.assertNumQueries(1):
+            response = self.auth_client.get(author_list_url)
 
         # Assert the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Extract the list of authors from the paginated response
-        authors = response.json().get("authors", [])  # Use "results" key for paginated data
+        authors = response.data.get("authors", [])
 
-        # Filter the authors created in this test
-        created_authors = {str(self.author.id), str(self.author2.id)}
+        # Expected authors keyed by their API URL: one dict lookup per
+        # returned author instead of re-splitting the URL per comparison
+        expected = {
+            self.author_api_url: self.author,
+            self.author2_api_url: self.author2,
+        }
 
         # Extract the IDs of authors returned by the API
-        returned_authors = {
-            [seg for seg in author["id"].split("/") if seg][-1]
-            for author in authors
-        }
-        # Assert that only the authors created in this test are returned
-        self.assertTrue(created_authors.issubset(returned_authors))
+        returned_urls = {author_data["id"] for author_data in authors}
+        # Assert that the authors created in this test are returned
+        self.assertTrue(set(expected).issubset(returned_urls))
 
-        # Dynamically check all authors created in this test
+        # Check the fields of every author created in this test; subTest
+        # surfaces every mismatching author in one run instead of stopping
+        # at the first failure
         for author_data in authors:
-            if author_data["id"].split("/")[-2] in created_authors:
-                if author_data["id"] == f"http://testserver/api/authors/{self.author.id}/":
-                    self.assertEqual(author_data["displayName"], self.author.display_name)
-                    self.assertEqual(author_data["github"], self.author.github)
-                    self.assertEqual(author_data["profileImage"], self.author.profile_image)
-                elif author_data["id"] == f"http://testserver/api/authors/{self.author2.id}/":
-                    self.assertEqual(author_data["displayName"], self.author2.display_name)
-                    self.assertEqual(author_data["github"], self.author2.github)
-                    self.assertEqual(author_data["profileImage"], self.author2.profile_image)
+            expected_author = expected.get(author_data["id"])
+            if expected_author is None:
+                continue
+            with self.subTest(author_id=author_data["id"]):
+                self.assertEqual(author_data["displayName"], expected_author.display_name)
+                self.assertEqual(author_data["github"], expected_author.github)
+                self.assertEqual(author_data["profileImage"], expected_author.profile_image)
     
     def test_author_list_with_node_auth(self):
         """
         Test that remote nodes can access author list with HTTP Basic Auth.
         """
-        auth_header = self.get_basic_auth_header("test_node", "test_pass")
-        
-        author_list_url = reverse("authors_api:authors-list")
-        response = self.client.get(
-            author_list_url,
-            HTTP_AUTHORIZATION=auth_header
+        # Only this test talks to the node table, so the row is created here
+        # rather than in the class-wide fixtures
+        RemoteNode.objects.create(
+            name="Test Node",
+            base_url="https://test.example.com/api/",
+            username="test_node",
+            password="test_pass",
+            is_active=True
         )
+        # Attach the header once; it persists for every request this
+        # client makes rather than being re-passed per call
+        self.client.credentials(HTTP_AUTHORIZATION=self.NODE_AUTH_HEADER)
+
+        author_list_url = self.author_list_url
+        # Node credential lookup + the author scan, nothing per-row
+        with self.assertNumQueries(2):
+            response = self.client.get(author_list_url)
         
         # Assert the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        
-        # Verify response structure matches API spec
-        self.assertIn('type', response.data)
-        self.assertEqual(response.data['type'], 'authors')
-        self.assertIn('authors', response.data)
-        
-        # Verify we get authors back
-        self.assertGreater(len(response.data['authors']), 0)
+
+        # Verify response structure matches API spec and has authors in it
+        data = response.data
+        self.assertEqual(data.get('type'), 'authors')
+        self.assertTrue(data.get('authors'))
     
     def test_author_detail(self): #Identity 3
         """
         Test that the API returns the correct details for a specific author.
         """
-        author_detail_url = reverse("authors_api:author-detail", kwargs={"pk": self.author.id})
+        author_detail_url = self.author_detail_url
         response = self.client.get(author_detail_url)
 
         # Assert the response status code is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Assert the JSON response contains the correct author details
-        self.assertEqual(response.json()["id"], f"http://testserver{author_detail_url}")
-        self.assertEqual(response.json()["displayName"], self.author.display_name)
-        self.assertEqual(response.json()["github"], self.author.github)
-        self.assertEqual(response.json()["profileImage"], self.author.profile_image)
+        # Assert the response contains the correct author details
+        data = response.data
+        self.assertEqual(data["id"], f"http://testserver{author_detail_url}")
+        self.assertEqual(data["displayName"], self.author.display_name)
+        self.assertEqual(data["github"], self.author.github)
+        self.assertEqual(data["profileImage"], self.author.profile_image)
 
     def test_author_profile_page(self): #Identity 5
         """
         Test that the public profile page for an author is accessible and displays the correct information.
         """
-        profile_url = reverse("authors:profile_detail", kwargs={"author_id": self.author.id})
+        profile_url = self.profile_url
         response = self.client.get(profile_url)
 
         # Assert the response status code is 200 OK
@@ -250,15 +331,16 @@ class AuthorAndEntryURLTests(APITestCase):
         self.assertContains(response, self.author.github)
         self.assertContains(response, self.author.profile_image)
 
-    @patch("entries.github_sync.fetch_github_activity")  
-    @patch("entries.models.Entry.objects.create")  
-    def test_github_activity_to_public_entries(self, mock_entry_create, mock_fetch_github_activity): #Identity 4
+    @patch("entries.github_sync.fetch_github_activity")
+    def test_github_activity_to_public_entries(self, mock_fetch_github_activity): #Identity 4
         """
-        Test that GitHub activity is automatically turned into public entries.
+        Test that GitHub activity is automatically turned into public entries,
+        exercising the real sync pipeline with only the GitHub fetch mocked.
         """
         # Mock GitHub activity response
         mock_fetch_github_activity.return_value = [
             {
+                "id": "1234567890",
                 "type": "PushEvent",
                 "repo": {"name": "test_author/test_repo"},
                 "payload": {
@@ -270,39 +352,24 @@ class AuthorAndEntryURLTests(APITestCase):
             }
         ]
 
-        # Simulate the GitHub activity sync
-        github_activity = mock_fetch_github_activity("test_author")
-
-        # Simulate creating entries from GitHub activity
-        for event in github_activity:
-            if event["type"] == "PushEvent":
-                repo_name = event["repo"]["name"]
-                commit_messages = "\n".join(commit["message"] for commit in event["payload"]["commits"])
-                content = f"New push to {repo_name}:\n{commit_messages}"
-                mock_entry_create(
-                    title=f"GitHub Activity: {event['type']}",
-                    description=f"Activity on {repo_name}",
-                    content=content,
-                    author=self.author,
-                    visibility=Visibility.PUBLIC,
-                )
-
-        # Assert that the mocked Entry creation was called
-        self.assertEqual(mock_entry_create.call_count, 1)
-        mock_entry_create.assert_called_with(
-            title="GitHub Activity: PushEvent",
-            description="Activity on test_author/test_repo",
-            content="New push to test_author/test_repo:\nInitial commit\nAdded README",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
+        created = create_github_entries_for_author(self.author)
+
+        # Assert the event became a public markdown entry
+        self.assertEqual(created, 1)
+        entry = Entry.objects.get(source_id="1234567890")
+        self.assertEqual(entry.author, self.author)
+        self.assertEqual(entry.title, "GitHub Activity: test_author/test_repo")
+        self.assertEqual(entry.visibility, Visibility.PUBLIC)
+        self.assertIn("Initial commit", entry.content)
+        self.assertIn("Added README", entry.content)
+
+        # A second sync of the same events is a no-op (source_id dedupe)
+        self.assertEqual(create_github_entries_for_author(self.author), 0)
 
     def test_create_markdown_entry(self): #Posting 5
         """
         Test that an author can create an entry with Markdown content.
         """
-        self.client.force_login(self.author)
-
         # Data for the new entry
         data = {
             "title": "Markdown Entry",
@@ -313,7 +380,7 @@ class AuthorAndEntryURLTests(APITestCase):
         }
 
         # API call to create the entry
-        response = self.client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
+        response = self.auth_client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
         print(response.content)  # Debugging: Print the response content
 
         # Assert the entry was created successfully
@@ -326,16 +393,8 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that an entry with Markdown content can be retrieved.
         """
-        # Create an entry with Markdown content
-        entry = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Markdown Entry",
-            description="This is a test entry with Markdown",
-            content="# Hello World\nThis is **bold** text.",
-            content_type="text/markdown",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
+        # Fixture entry with Markdown content
+        entry = self.markdown_entry
 
         # API call to retrieve the entry
         response = self.client.get(f'/api/entries/{entry.id}/')
@@ -351,16 +410,8 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that Markdown content is rendered correctly (if applicable).
         """
-        # Create an entry with Markdown content
-        entry = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Markdown Entry",
-            description="This is a test entry with Markdown",
-            content="# Hello World\nThis is **bold** text.",
-            content_type="text/markdown",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
+        # Fixture entry with Markdown content
+        entry = self.markdown_entry
 
         # API call to retrieve the rendered content
         response = self.client.get(f'/api/entries/{entry.id}/rendered/')
@@ -369,8 +420,8 @@ class AuthorAndEntryURLTests(APITestCase):
         # Assert the response status code
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Parse the JSON response
-        response_data = response.json()  # Use the `json()` method to parse the response content
+        # Plain JsonResponse (not a DRF Response), so parse the body
+        response_data = response.json()
 
         # Assert the rendered content is correct
         self.assertIn("<h1>Hello World</h1>", response_data['rendered_content'])
@@ -380,20 +431,17 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that an author can create an entry with image content.
         """
-        self.client.force_login(self.author)
-
         # Data for the new image entry
         data = {
             "title": "Image Entry",
             "description": "This is a test entry with an image.",
-            "content": "data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUA"
-                    "AAAABCAIAAACQd1PeAAAAEElEQVR42mP8/5+hPAAHggJ/P9ZqAAAAAElFTkSuQmCC",
+            "content": TINY_PNG_B64,
             "contentType": "image/png;base64",  # Matches CONTENT_TYPE_CHOICES
             "visibility": "PUBLIC"  # Matches VISIBILITY_CHOICES
         }
 
         # API call to create the entry
-        response = self.client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
+        response = self.auth_client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
         print(response.content)  # Debugging: Print the response content
 
         # Assert the entry was created successfully
@@ -405,17 +453,8 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that an image entry can be retrieved.
         """
-        # Create an image entry
-        entry = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Image Entry",
-            description="This is a test entry with an image.",
-            content="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUA"
-                    "AAAABCAIAAACQd1PeAAAAEElEQVR42mP8/5+hPAAHggJ/P9ZqAAAAAElFTkSuQmCC",
-            content_type="image/png;base64",
-            author=self.author,
-            visibility=Visibility.PUBLIC,
-        )
+        # Fixture image entry
+        entry = self.image_entry_public
 
         # API call to retrieve the entry
         response = self.client.get(f'/api/entries/{entry.id}/')
@@ -431,8 +470,6 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that invalid image content is rejected.
         """
-        self.client.force_login(self.author)  # Log in as the author
-
         # Data with invalid content_type
         data = {
             "title": "Invalid Image Entry",
@@ -443,7 +480,7 @@ class AuthorAndEntryURLTests(APITestCase):
         }
 
         # API call to create the entry
-        response = self.client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
+        response = self.auth_client.post(f'/api/author/{self.author.id}/entries/', data, format='json')
 
         # Assert the entry creation failed
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -452,25 +489,15 @@ class AuthorAndEntryURLTests(APITestCase):
         """
         Test that visibility rules apply to image entries.
         """
-        # Create a friends-only image entry
-        entry = Entry.objects.create(
-            id=uuid.uuid4(),
-            title="Friends Image Entry",
-            description="This is a friends-only image entry.",
-            content="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAUA"
-                    "AAAABCAIAAACQd1PeAAAAEElEQVR42mP8/5+hPAAHggJ/P9ZqAAAAAElFTkSuQmCC",
-            content_type="image/png;base64",
-            author=self.author,
-            visibility=Visibility.FRIENDS,
-        )
+        # Fixture friends-only image entry
+        entry = self.image_entry_friends
 
         # Anonymous user tries to access the entry
         response = self.client.get(f'/api/entries/{entry.id}/')
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
-        # Author logs in and accesses the entry
-        self.client.force_login(self.author)
-        response = self.client.get(f'/api/entries/{entry.id}/')
+        # Author accesses the entry through the authenticated client
+        response = self.auth_client.get(f'/api/entries/{entry.id}/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_render_markdown_entry_with_image(self): #Posting 8
@@ -481,7 +508,6 @@ class AuthorAndEntryURLTests(APITestCase):
         response = self.client.get(f'/api/entries/{self.markdown_entry_with_image.id}/rendered/')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-        # Parse the JSON response
         response_data = response.json()
 
         # Assert the rendered content includes the correct HTML for the image
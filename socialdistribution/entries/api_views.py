@@ -3,15 +3,27 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 import base64
 import binascii
+import re
+import uuid
+from dataclasses import dataclass
 from urllib.parse import unquote
 from django.shortcuts import get_object_or_404
 from django.http import Http404
-from django.db.models import Q
+from django.db.models import Count, Exists, F, Max, OuterRef, Prefetch, Q, Value
+from hashlib import blake2b
 from django.urls import reverse
-from .models import Entry, Visibility, Comment, RemoteNode
+from django.core.cache import cache
+
+from .models import (
+    Entry,
+    Visibility,
+    Comment,
+    RemoteNode,
+    PUBLIC_FEED_VALIDATOR_KEY,
+)
 from authors.models import FollowRequest, FollowRequestStatus, Author
 from authors.serializers import AuthorSerializer
-from .serializers import EntrySerializer, CommentSerializer, InboxItemSerializer
+from .serializers import EntrySerializer, CommentSerializer, InboxItemSerializer, api_url_roots
 from django.http import JsonResponse
 import commonmark
 from rest_framework.decorators import api_view, permission_classes
@@ -47,17 +59,105 @@ def resolve_author_or_404(identifier: str) -> Author:
         if last_segment and last_segment not in candidates:
             candidates.append(last_segment)
 
+    # Only parseable UUIDs can match the pk; dropping the rest up front
+    # lets one IN query replace a .get() round trip per candidate
+    author_ids = []
     for candidate in candidates:
-        if not candidate:
-            continue
         try:
-            return Author.objects.get(id=candidate)
-        except (Author.DoesNotExist, ValueError):
+            author_ids.append(uuid.UUID(candidate))
+        except ValueError:
             continue
 
+    if author_ids:
+        author = Author.objects.filter(id__in=author_ids).first()
+        if author is not None:
+            return author
+
     raise Http404("Author not found")
 
 
+@dataclass(frozen=True)
+class Pagination:
+    page: int
+    size: int
+    start: int
+    end: int
+
+
+def parse_pagination(request, default_size=10, max_size=100):
+    """
+    Parse and clamp ?page/?size once per request. The max_size clamp is
+    the important part: it bounds worst-case slice and serialization cost
+    no matter what a client sends. Malformed values fall back to the
+    defaults instead of raising.
+    """
+    try:
+        page = int(request.query_params.get("page", 1))
+    except (TypeError, ValueError):
+        page = 1
+    try:
+        size = int(request.query_params.get("size", default_size))
+    except (TypeError, ValueError):
+        size = default_size
+    page = max(1, page)
+    size = min(max_size, max(1, size))
+    start = (page - 1) * size
+    return Pagination(page=page, size=size, start=start, end=start + size)
+
+
+def get_visible_comment_or_404(comment_id, user, extra_annotations=None):
+    """
+    Fetch a comment together with everything needed to decide whether its
+    entry is visible to the viewer, in one query: the entry/author join
+    plus both follow directions as EXISTS subqueries for authenticated
+    viewers. entry.can_view() would probe each direction with its own
+    query after the fetch.
+    """
+    qs = Comment.objects.filter(id=comment_id).select_related(
+        "entry", "entry__author", "author"
+    )
+    if extra_annotations:
+        qs = qs.annotate(**extra_annotations)
+    if user.is_authenticated:
+        qs = qs.annotate(
+            author_follows_viewer=Exists(
+                FollowRequest.objects.filter(
+                    follower_id=OuterRef("entry__author_id"),
+                    followee=user,
+                    status=FollowRequestStatus.APPROVED,
+                )
+            ),
+            viewer_follows_author=Exists(
+                FollowRequest.objects.filter(
+                    follower=user,
+                    followee_id=OuterRef("entry__author_id"),
+                    status=FollowRequestStatus.APPROVED,
+                )
+            ),
+        )
+    comment = qs.first()
+    if comment is None:
+        raise Http404("Comment not found")
+
+    # Same rules as Entry.can_view, decided from the annotated row
+    entry = comment.entry
+    visible = entry.visibility in (Visibility.PUBLIC, Visibility.UNLISTED) or (
+        user.is_authenticated
+        and entry.visibility != Visibility.DELETED
+        and (
+            user.id == entry.author_id
+            or (
+                entry.visibility == Visibility.FRIENDS
+                and comment.author_follows_viewer
+                and comment.viewer_follows_author
+            )
+        )
+    )
+    if not visible:
+        raise Http404("Comment not found")
+    return comment
+
+
 def _resolve_remote_author_from_data(author_data: dict) -> Optional[Author]:
     """
     Given the 'author' object from a remote payload, return a local Author instance
@@ -138,6 +238,11 @@ def _resolve_remote_author_from_data(author_data: dict) -> Optional[Author]:
 
 LIKE_ID_SEPARATOR = "|"
 
+# Unpadded urlsafe base64; checked up front so malformed identifiers (a
+# favourite of clients spraying bad cursors) are rejected without paying
+# for a decode attempt and exception unwind
+_LIKE_ID_RE = re.compile(r"^[A-Za-z0-9_\-]{1,256}$")
+
 
 def encode_like_identifier(object_type: str, object_id: str, author_id: str) -> str:
     raw_value = f"{object_type}{LIKE_ID_SEPARATOR}{object_id}{LIKE_ID_SEPARATOR}{author_id}"
@@ -145,13 +250,19 @@ def encode_like_identifier(object_type: str, object_id: str, author_id: str) ->
 
 
 def decode_like_identifier(identifier: str) -> tuple[str, str, str]:
+    # No base64 string is ever 1 (mod 4) characters long unpadded, and
+    # such input makes urlsafe_b64decode raise despite the alphabet check
+    if not _LIKE_ID_RE.match(identifier) or len(identifier) % 4 == 1:
+        raise Http404("Like not found")
     padding = "=" * (-len(identifier) % 4)
+    raw_value = base64.urlsafe_b64decode(identifier + padding)
+    parts = raw_value.split(LIKE_ID_SEPARATOR.encode("ascii"))
+    if len(parts) != 3:
+        raise Http404("Like not found")
     try:
-        raw_value = base64.urlsafe_b64decode((identifier + padding).encode("ascii")).decode("utf-8")
-        object_type, object_id, author_id = raw_value.split(LIKE_ID_SEPARATOR)
-    except (ValueError, UnicodeDecodeError, binascii.Error):
+        return tuple(part.decode("utf-8") for part in parts)
+    except UnicodeDecodeError:
         raise Http404("Like not found")
-    return object_type, object_id, author_id
 
 
 class LikeSerializerMixin:
@@ -163,15 +274,25 @@ class LikeSerializerMixin:
         return str(author)
 
     def _serialize_author(self, request, author: Author) -> dict:
+        # Memoized per request: the liked list serializes the same liker
+        # for every row, and like pages often repeat authors too
+        cache = getattr(request, "_author_payload_cache", None)
+        if cache is None:
+            cache = request._author_payload_cache = {}
+        cached = cache.get(author.id)
+        if cached is not None:
+            return cached
         data = AuthorSerializer(author, context={"request": request}).data
         data["apiId"] = data.get("id")
         data["id"] = str(author.id)
+        cache[author.id] = data
         return data
 
     def _build_entry_like_object(self, request, entry: Entry, liker: Author) -> dict:
-        object_url = request.build_absolute_uri(reverse("api:entry-detail", args=[entry.id]))
+        roots = api_url_roots(request)
+        object_url = f"{roots['entries_api']}{entry.id}/"
         like_identifier = encode_like_identifier("entry", str(entry.id), str(liker.id))
-        like_id = request.build_absolute_uri(reverse("api:liked-detail", args=[like_identifier]))
+        like_id = f"{roots['liked_api']}{like_identifier}/"
         entry_title = getattr(entry, "title", "") or "an entry"
         summary = f"{self._liker_display_name(liker)} likes {entry_title}"
         return {
@@ -183,9 +304,10 @@ class LikeSerializerMixin:
         }
 
     def _build_comment_like_object(self, request, comment: Comment, liker: Author) -> dict:
-        object_url = request.build_absolute_uri(reverse("api:comment-detail", args=[comment.id]))
+        roots = api_url_roots(request)
+        object_url = f"{roots['comments_api']}{comment.id}/"
         like_identifier = encode_like_identifier("comment", str(comment.id), str(liker.id))
-        like_id = request.build_absolute_uri(reverse("api:liked-detail", args=[like_identifier]))
+        like_id = f"{roots['liked_api']}{like_identifier}/"
         entry_title = getattr(comment.entry, "title", "")
         target = f"a comment on {entry_title}" if entry_title else "a comment"
         summary = f"{self._liker_display_name(liker)} likes {target}"
@@ -198,6 +320,43 @@ class LikeSerializerMixin:
             "published": timezone.now().isoformat(),
         }
 
+    def _paginate_likes(self, request, likes_qs):
+        """
+        Slice a likes queryset for a list response.
+
+        With ?cursor=<last author id> the page is a keyset scan
+        (WHERE id > cursor ORDER BY id LIMIT size+1) and no COUNT runs, so
+        deep pages cost the same as the first; next_cursor is returned
+        while more rows remain. Without a cursor the spec's page/size
+        OFFSET pagination (with count) is preserved for existing clients.
+        Returns (likes_page, envelope_fields).
+        """
+        pagination = parse_pagination(request, default_size=5)
+        size = pagination.size
+        cursor = request.query_params.get("cursor")
+
+        if cursor is not None:
+            qs = likes_qs.order_by("id")
+            if cursor:
+                # Validate before the queryset evaluates: a malformed value
+                # would otherwise raise ValidationError mid-response (500)
+                try:
+                    cursor_id = uuid.UUID(cursor)
+                except ValueError:
+                    raise Http404("Invalid cursor")
+                qs = qs.filter(id__gt=cursor_id)
+            rows = list(qs[:size + 1])
+            has_more = len(rows) > size
+            rows = rows[:size]
+            next_cursor = str(rows[-1].id) if has_more and rows else None
+            return rows, {"size": size, "next_cursor": next_cursor}
+
+        return list(likes_qs[pagination.start:pagination.end]), {
+            "page_number": pagination.page,
+            "size": size,
+            "count": likes_qs.count(),
+        }
+
     def _retrieve_like_object(self, request, like_identifier: str, expected_author_id: str | None = None) -> dict:
         object_type, object_id, author_id = decode_like_identifier(like_identifier)
         liker = get_object_or_404(Author, id=author_id)
@@ -224,20 +383,54 @@ class PublicEntriesListView(generics.ListAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_queryset(self):
+        # Prefetch everything the serializer walks per entry (likes,
+        # comments with their authors, comment likes) so a page renders in
+        # a constant number of queries instead of several per entry.
+        # content is not deferred here: the serializer ships it in the
+        # payload, so there is nothing to save by narrowing this query.
         return (
             Entry.objects.filter(visibility=Visibility.PUBLIC)
             .select_related("author")
+            .prefetch_related(
+                "liked_by",
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related("author").annotate(
+                        num_likes=Count("liked_by")
+                    ),
+                ),
+            )
             .order_by("-published")
         )
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
 
-        page = max(1, int(request.query_params.get("page", 1)))
-        size = max(1, int(request.query_params.get("size", 10)))
-        start = (page - 1) * size
-        end = start + size
-
-        page_qs = queryset[start:end]
+        pagination = parse_pagination(request)
+
+        # Conditional GET: a few aggregates stand in for the rendered page.
+        # Comment/like totals are folded in because they are embedded in
+        # the payload but don't bump Entry.updated. The computed validator
+        # is cached (signal receivers in models.py delete it on any
+        # entry/comment/like write) so the comment and like tables aren't
+        # re-counted on every request.
+        validator = cache.get(PUBLIC_FEED_VALIDATOR_KEY)
+        if validator is None:
+            agg = Entry.objects.filter(visibility=Visibility.PUBLIC).aggregate(
+                m=Max("updated"), c=Count("id")
+            )
+            validator = "-".join(str(v) for v in (
+                agg["m"], agg["c"], Comment.objects.count(),
+                Entry.liked_by.through.objects.count(),
+            ))
+            cache.set(PUBLIC_FEED_VALIDATOR_KEY, validator, 60)
+        etag = 'W/"%s"' % blake2b(
+            f"{validator}-{pagination.page}-{pagination.size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+        page_qs = queryset[pagination.start:pagination.end]
         serializer = self.get_serializer(
             page_qs, many=True, context={"request": request}
         )
@@ -245,42 +438,53 @@ class PublicEntriesListView(generics.ListAPIView):
         return Response(
             {
                 "type": "entries",
-                "page_number": page,
-                "size": size,
+                "page_number": pagination.page,
+                "size": pagination.size,
                 "count": queryset.count(),
                 "src": serializer.data,
-            }
+            },
+            headers={"ETag": etag},
         )
 
 
-class EntryDetailView(generics.RetrieveUpdateDestroyAPIView):
+class EntryDetailView(generics.RetrieveAPIView):
     """
     GET /api/entries/<uuid:entry_id>/
     Returns a single entry if visible to the requester.
+
+    Read-only: writes go through EntryEditDeleteView, which enforces
+    authentication, author ownership and soft-delete.
     """
     serializer_class = EntrySerializer
     permission_classes = [permissions.AllowAny]
 
-    def get_object(self, entry_id):
+    def get_object(self):
         """
         Retrieves the entry object from the database and returns it unless incorrect visibility.
         Uses the `entry_id` path parameter.
         """
-        entry = get_object_or_404(Entry, id=entry_id)
-
-        if entry.visibility == "DELETED":
-            raise Http404("Entry not found")
-
-        if entry.visibility == Visibility.FRIENDS and (
-            not self.request.user.is_authenticated
-            or (
-                entry.author != self.request.user
-                and not entry.author.follow_requests_sent.filter(
-                    followee=self.request.user,
-                    status=FollowRequestStatus.APPROVED,
-                ).exists()
+        # One indexed query decides existence, non-deleted, and visibility
+        # instead of fetching the row and then probing the follow table
+        entry_id = self.kwargs["entry_id"]
+        user = self.request.user
+        visibility_q = Q(visibility=Visibility.PUBLIC) | Q(visibility=Visibility.UNLISTED)
+        if user.is_authenticated:
+            visibility_q |= Q(author=user)
+            visibility_q |= Q(
+                visibility=Visibility.FRIENDS,
+                author__follow_requests_sent__followee=user,
+                author__follow_requests_sent__status=FollowRequestStatus.APPROVED,
             )
-        ):
+
+        entry = (
+            Entry.objects.filter(id=entry_id)
+            .exclude(visibility=Visibility.DELETED)
+            .filter(visibility_q)
+            .select_related("author")
+            .annotate(num_likes=Count("liked_by", distinct=True))
+            .first()
+        )
+        if entry is None:
             raise Http404("Entry not found")
 
         return entry
@@ -290,8 +494,20 @@ class EntryDetailView(generics.RetrieveUpdateDestroyAPIView):
         Explicit GET handler kept for backwards compatibility and clarity.
         """
         entry = self.get_object()
+
+        # Conditional GET after the visibility checks: updated plus the
+        # embedded like/comment counts make a cheap weak validator, so
+        # re-polling clients get a bodyless 304 instead of a full render
+        etag = 'W/"{}-{}-{}"'.format(
+            entry.updated.timestamp(),
+            entry.num_likes,
+            entry.comments.count(),
+        )
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
         serializer = EntrySerializer(entry, context={"request": request})
-        return Response(serializer.data)
+        return Response(serializer.data, headers={"ETag": etag})
     
 def send_comment_to_remote_followers(comment: Comment, request):
     """
@@ -675,9 +891,20 @@ class MyEntriesListView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get_queryset(self):
+        # Same per-page prefetching as the public list (see above)
         return (
             Entry.objects.filter(author=self.request.user)
             .exclude(visibility="DELETED")
+            .select_related("author")
+            .prefetch_related(
+                "liked_by",
+                Prefetch(
+                    "comments",
+                    queryset=Comment.objects.select_related("author").annotate(
+                        num_likes=Count("liked_by")
+                    ),
+                ),
+            )
             .order_by("-published")
         )
 
@@ -688,8 +915,25 @@ class MyEntriesListView(generics.ListCreateAPIView):
 
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
+
+        # Optional page/size keep the working set bounded for authors with
+        # long histories; requests without them keep returning everything
+        # so existing clients are unaffected.
+        envelope = {"type": "entries"}
+        if "page" in request.query_params or "size" in request.query_params:
+            pagination = parse_pagination(request)
+            envelope.update(
+                {
+                    "page_number": pagination.page,
+                    "size": pagination.size,
+                    "count": queryset.count(),
+                }
+            )
+            queryset = queryset[pagination.start:pagination.end]
+
         serializer = self.get_serializer(queryset, many=True, context={"request": request})
-        return Response({"type": "entries", "src": serializer.data})
+        envelope["src"] = serializer.data
+        return Response(envelope)
 
 
 class EntryEditDeleteView(generics.RetrieveUpdateDestroyAPIView):
@@ -780,14 +1024,7 @@ class EntryLikesListView(LikeSerializerMixin, APIView):
         if not entry.can_view(request.user):
             raise Http404("Entry not found")
 
-        page = max(1, int(request.query_params.get("page", 1)))
-        size = max(1, int(request.query_params.get("size", 5)))
-        start = (page - 1) * size
-        end = start + size
-
-        likes_qs = entry.liked_by.all()
-        count = likes_qs.count()
-        likes_page = likes_qs[start:end]
+        likes_page, page_fields = self._paginate_likes(request, entry.liked_by.all())
 
         likes_api_url = request.build_absolute_uri(reverse("api:entry-likes", args=[entry.id]))
         entry_html_url = request.build_absolute_uri(reverse("entries:view_entry", args=[entry.id]))
@@ -799,9 +1036,7 @@ class EntryLikesListView(LikeSerializerMixin, APIView):
                 "type": "likes",
                 "web": entry_html_url,
                 "id": likes_api_url,
-                "page_number": page,
-                "size": size,
-                "count": count,
+                **page_fields,
                 "items": src,
                 "src": src,
             }
@@ -820,14 +1055,7 @@ class AuthorEntryLikesListView(LikeSerializerMixin, APIView):
         if not entry.can_view(request.user):
             raise Http404("Entry not found")
 
-        page = max(1, int(request.query_params.get("page", 1)))
-        size = max(1, int(request.query_params.get("size", 5)))
-        start = (page - 1) * size
-        end = start + size
-
-        likes_qs = entry.liked_by.all()
-        count = likes_qs.count()
-        likes_page = likes_qs[start:end]
+        likes_page, page_fields = self._paginate_likes(request, entry.liked_by.all())
 
         likes_api_url = request.build_absolute_uri(
             reverse("api:author-entry-likes", args=[entry.author.id, entry.id])
@@ -841,9 +1069,7 @@ class AuthorEntryLikesListView(LikeSerializerMixin, APIView):
                 "type": "likes",
                 "web": entry_html_url,
                 "id": likes_api_url,
-                "page_number": page,
-                "size": size,
-                "count": count,
+                **page_fields,
                 "src": src,
             }
         )
@@ -862,14 +1088,7 @@ class CommentLikesListView(LikeSerializerMixin, APIView):
             raise Http404("Comment not found")
         comment = get_object_or_404(Comment, id=comment_id, entry=entry)
 
-        page = max(1, int(request.query_params.get("page", 1)))
-        size = max(1, int(request.query_params.get("size", 5)))
-        start = (page - 1) * size
-        end = start + size
-
-        likes_qs = comment.liked_by.all()
-        count = likes_qs.count()
-        likes_page = likes_qs[start:end]
+        likes_page, page_fields = self._paginate_likes(request, comment.liked_by.all())
 
         likes_api_url = request.build_absolute_uri(
             reverse(
@@ -886,9 +1105,7 @@ class CommentLikesListView(LikeSerializerMixin, APIView):
                 "type": "likes",
                 "web": entry_html_url,
                 "id": likes_api_url,
-                "page_number": page,
-                "size": size,
-                "count": count,
+                **page_fields,
                 "src": src,
             }
         )
@@ -909,29 +1126,48 @@ class AuthorLikedListView(LikeSerializerMixin, APIView):
         return self._build_response(request, liker)
 
     def _build_response(self, request, liker: Author) -> Response:
-        page = max(1, int(request.query_params.get("page", 1)))
-        size = max(1, int(request.query_params.get("size", 10)))
-        start = (page - 1) * size
-        end = start + size
+        pagination = parse_pagination(request)
 
-        entry_likes = (
+        # Narrow (id, kind, timestamp) rows from both tables, combined and
+        # sliced in the database; only the requested page is hydrated, so
+        # the work per request is bounded by the page size rather than the
+        # author's whole like history.
+        entry_q = (
             Entry.objects.filter(liked_by=liker)
-            .select_related("author")
-            .order_by("-published")
+            .annotate(kind=Value("entry"), ord_ts=F("published"))
+            .values("id", "kind", "ord_ts")
         )
-        comment_likes = (
+        comment_q = (
             Comment.objects.filter(liked_by=liker)
-            .select_related("entry", "entry__author")
-            .order_by("-created_at")
+            .annotate(kind=Value("comment"), ord_ts=F("created_at"))
+            .values("id", "kind", "ord_ts")
+        )
+        page_rows = list(
+            entry_q.union(comment_q, all=True)
+            .order_by("-ord_ts")[pagination.start:pagination.end]
         )
 
-        items = [self._build_entry_like_object(request, entry, liker) for entry in entry_likes]
-        items.extend(
-            self._build_comment_like_object(request, comment, liker) for comment in comment_likes
+        # Hydrate just the page, and just the columns the like objects
+        # read (id + title for the summary/object URL). Skipping content
+        # matters most for image entries, whose inline base64 payload can
+        # be orders of magnitude larger than the rest of the row.
+        entries = Entry.objects.only("id", "title").in_bulk(
+            [row["id"] for row in page_rows if row["kind"] == "entry"]
         )
+        comments = (
+            Comment.objects.select_related("entry")
+            .only("id", "entry__id", "entry__title")
+            .in_bulk([row["id"] for row in page_rows if row["kind"] == "comment"])
+        )
+
+        src = [
+            self._build_entry_like_object(request, entries[row["id"]], liker)
+            if row["kind"] == "entry"
+            else self._build_comment_like_object(request, comments[row["id"]], liker)
+            for row in page_rows
+        ]
 
-        count = len(items)
-        src = items[start:end]
+        count = entry_q.count() + comment_q.count()
 
         liked_api_url = request.build_absolute_uri(reverse("api:author-liked", args=[liker.id]))
 
@@ -939,8 +1175,8 @@ class AuthorLikedListView(LikeSerializerMixin, APIView):
             {
                 "type": "likes",
                 "id": liked_api_url,
-                "page_number": page,
-                "size": size,
+                "page_number": pagination.page,
+                "size": pagination.size,
                 "count": count,
                 "src": src,
             }
@@ -1070,21 +1306,45 @@ class EntryCommentsListCreateView(generics.ListCreateAPIView):
     def get_entry(self):
         if self._entry is not None:
             return self._entry
-        entry = get_object_or_404(Entry, id=self.kwargs["entry_id"])
-        if not entry.can_view(self.request.user):
+        # One indexed query decides existence and visibility together,
+        # instead of fetching the row and then running can_view()'s
+        # per-direction follow .exists() probes. Matches can_view():
+        # PUBLIC/UNLISTED are open, authors see their own non-deleted
+        # entries, FRIENDS needs an approved follow both ways.
+        user = self.request.user
+        visible = Q(visibility__in=[Visibility.PUBLIC, Visibility.UNLISTED])
+        if user.is_authenticated:
+            visible |= Q(author=user) & ~Q(visibility=Visibility.DELETED)
+            visible |= Q(
+                visibility=Visibility.FRIENDS,
+                author__follow_requests_sent__followee=user,
+                author__follow_requests_sent__status=FollowRequestStatus.APPROVED,
+            ) & Q(
+                author__follow_requests_received__follower=user,
+                author__follow_requests_received__status=FollowRequestStatus.APPROVED,
+            )
+        entry = (
+            Entry.objects.filter(Q(id=self.kwargs["entry_id"]) & visible)
+            .only("id", "visibility", "author_id")
+            .first()
+        )
+        if entry is None:
             raise Http404("Entry not found")
         self._entry = entry
         return entry
 
     def get_queryset(self):
         entry = self.get_entry()
-        comments = entry.comments.select_related("author")
+        comments = entry.comments.select_related("author").annotate(
+            num_likes=Count("liked_by")
+        )
         if (
             entry.visibility == Visibility.FRIENDS
             and self.request.user.is_authenticated
-            and self.request.user != entry.author
+            and self.request.user.id != entry.author_id
         ):
-            comments = comments.filter(author__in=[self.request.user, entry.author])
+            # author_id avoids re-fetching the deferred author row
+            comments = comments.filter(author_id__in=[self.request.user.id, entry.author_id])
         return comments.order_by("created_at")
 
     def list(self, request, *args, **kwargs):
@@ -1121,13 +1381,12 @@ class CommentDetailView(generics.RetrieveAPIView):
     permission_classes = [permissions.AllowAny]
 
     def get_object(self):
-        comment = get_object_or_404(
-            Comment.objects.select_related("entry", "author"),
-            id=self.kwargs["comment_id"],
+        comment = get_visible_comment_or_404(
+            self.kwargs["comment_id"],
+            self.request.user,
+            extra_annotations={"num_likes": Count("liked_by")},
         )
         entry = comment.entry
-        if not entry.can_view(self.request.user):
-            raise Http404("Comment not found")
         if (
             entry.visibility == Visibility.FRIENDS
             and self.request.user != entry.author
@@ -1197,13 +1456,8 @@ class CommentLikeView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request, comment_id):
-        comment = get_object_or_404(
-            Comment.objects.select_related("entry"),
-            id=comment_id,
-        )
+        comment = get_visible_comment_or_404(comment_id, request.user)
         entry = comment.entry
-        if not entry.can_view(request.user):
-            raise Http404("Comment not found")
         if (
             entry.visibility == Visibility.FRIENDS
             and request.user not in {entry.author, comment.author}
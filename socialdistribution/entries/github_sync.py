@@ -32,7 +32,14 @@ def create_github_entries_for_author(author):
     if not events:
         return 0
 
-    created_count = 0
+    # Avoid duplicates based on event ID: one IN query up front instead of
+    # an .exists() round trip per event
+    event_ids = [event.get("id") for event in events]
+    existing_ids = set(
+        Entry.objects.filter(source_id__in=event_ids).values_list("source_id", flat=True)
+    )
+
+    new_entries = []
 
     for event in events:
         event_id = event.get("id")
@@ -40,8 +47,7 @@ def create_github_entries_for_author(author):
         repo = event.get("repo", {}).get("name", "")
         created_at = event.get("created_at")
 
-        # Avoid duplicates based on event ID
-        if Entry.objects.filter(source_id=event_id).exists():
+        if event_id in existing_ids:
             continue
 
         # Format the content depending on the event type
@@ -72,14 +78,16 @@ def create_github_entries_for_author(author):
         else:
             continue  # Skip events not included above
 
-        Entry.objects.create(
+        new_entries.append(Entry(
             author=author,
             title=f"GitHub Activity: {repo}",
             content=content,
             content_type="text/markdown",
             visibility="PUBLIC",
             source_id=event_id,
-        )
-        created_count += 1
+        ))
+
+    # One multi-VALUES INSERT for the whole sync instead of N .create() calls
+    Entry.objects.bulk_create(new_entries)
 
-    return created_count
+    return len(new_entries)
@@ -0,0 +1,13 @@
+# entries/management/commands/refresh_explore_snapshot.py
+from django.core.management.base import BaseCommand
+from authors.api_views import ExploreAuthorsView
+
+
+class Command(BaseCommand):
+    help = "Precomputes the remote-author snapshot served by the explore endpoint"
+
+    def handle(self, *args, **options):
+        remote_authors = ExploreAuthorsView.refresh_snapshot()
+        self.stdout.write(
+            self.style.SUCCESS(f"Snapshot refreshed: {len(remote_authors)} remote authors")
+        )
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-08-28 11:01
+
+from urllib.parse import urlsplit
+
+from django.db import migrations, models
+
+
+def populate_netloc(apps, schema_editor):
+    RemoteNode = apps.get_model('entries', 'RemoteNode')
+    for node in RemoteNode.objects.all():
+        node.netloc = urlsplit(node.base_url).netloc
+        node.save(update_fields=['netloc'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entries', '0015_comment_content_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='remotenode',
+            name='netloc',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(populate_netloc, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-08-28 11:26
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entries', '0016_remotenode_netloc'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['visibility', '-published'], name='entry_vis_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['author', '-published'], name='entry_auth_pub_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='entry',
+            index=models.Index(fields=['visibility', '-published', 'id'], name='entry_vis_pub_id_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-08-28 11:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('entries', '0017_entry_entry_vis_pub_idx_entry_entry_auth_pub_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='remotenode',
+            name='base_url',
+            field=models.URLField(help_text='e.g., https://team-dodgerblue.herokuapp.com', unique=True),
+        ),
+    ]
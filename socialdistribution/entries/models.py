@@ -1,8 +1,12 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
 
 from authors.models import Author, FollowRequest, FollowRequestStatus
 import uuid
+from urllib.parse import urlsplit
 
 User = get_user_model()
 
@@ -118,6 +122,15 @@ class Entry(models.Model):
     class Meta:
         ordering = ['-published']  # Most recent first
         verbose_name_plural = 'Entries'
+        indexes = [
+            # Feed queries filter on visibility or author and order by
+            # -published with LIMIT; these let the planner walk an index
+            # instead of seq-scan + sort. The id tiebreak supports stable
+            # keyset pagination.
+            models.Index(fields=["visibility", "-published"], name="entry_vis_pub_idx"),
+            models.Index(fields=["author", "-published"], name="entry_auth_pub_idx"),
+            models.Index(fields=["visibility", "-published", "id"], name="entry_vis_pub_id_idx"),
+        ]
     
     def __str__(self):
         return f"{self.title} by {self.author.display_name}"
@@ -164,16 +177,45 @@ class Comment(models.Model):
 class RemoteNode(models.Model):
     """Stores credentials for connecting to other team's nodes"""
     name = models.CharField(max_length=100, unique=True)  # "Team Blue"
-    base_url = models.URLField(help_text="e.g., https://team-dodgerblue.herokuapp.com") # Host URL
+    base_url = models.URLField(unique=True, help_text="e.g., https://team-dodgerblue.herokuapp.com") # Host URL
+    # Parsed from base_url at save time so URL-matching lookups are an
+    # indexed equality filter instead of per-request urlparse/startswith
+    netloc = models.CharField(max_length=255, blank=True, default='', db_index=True, editable=False)
     username = models.CharField(max_length=100, blank=True, default='', help_text="Username they gave us")
     password = models.CharField(max_length=100, blank=True, default='', help_text="Password they gave us")
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    
+
+    def save(self, *args, **kwargs):
+        # Parse once here rather than urlparse on every use
+        self.netloc = urlsplit(self.base_url).netloc
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.name} ({self.base_url})"
     
     class Meta:
         verbose_name = "Remote Node"
-        verbose_name_plural = "Remote Nodes"
\ No newline at end of file
+        verbose_name_plural = "Remote Nodes"
+
+# Cache key for the public-entries list ETag validator. The list view
+# caches the computed validator under this key for a short TTL and any
+# write that changes the rendered feed (entries, comments, likes on
+# either) deletes it here, so conditional GETs never rescan the comment
+# and like tables per request.
+PUBLIC_FEED_VALIDATOR_KEY = "entries:public-feed-validator"
+
+
+@receiver(post_save, sender=Entry)
+@receiver(post_delete, sender=Entry)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def _invalidate_public_feed_validator(sender, **kwargs):
+    cache.delete(PUBLIC_FEED_VALIDATOR_KEY)
+
+
+@receiver(m2m_changed, sender=Entry.liked_by.through)
+@receiver(m2m_changed, sender=Comment.liked_by.through)
+def _invalidate_public_feed_validator_on_like(sender, **kwargs):
+    cache.delete(PUBLIC_FEED_VALIDATOR_KEY)
@@ -1,10 +1,40 @@
 from rest_framework import serializers
-from django.urls import reverse
 
 from .models import Entry, Comment
 from authors.serializers import AuthorSerializer
 
 
+def api_url_roots(request):
+    """
+    Absolute URL roots for the endpoints serializers link to, computed once
+    per request. reverse() walks the URL resolver's regex tree and
+    build_absolute_uri() re-parses the URL on every call, which adds up to
+    hundreds of resolver hits when serializing a page of entries with their
+    comments and likes; after the first call each row is one f-string.
+    """
+    roots = getattr(request, "_api_url_roots", None)
+    if roots is None:
+        site = request.build_absolute_uri("/")
+        roots = {
+            "entries_api": f"{site}api/entries/",
+            "comments_api": f"{site}api/comments/",
+            "liked_api": f"{site}api/liked/",
+            "entries_web": f"{site}entries/",
+        }
+        request._api_url_roots = roots
+    return roots
+
+
+def _iso_datetime(value):
+    """Render a datetime the way DRF's DateTimeField does (ISO 8601, Z-suffixed UTC)."""
+    if value is None:
+        return None
+    rendered = value.isoformat()
+    if rendered.endswith("+00:00"):
+        rendered = rendered[:-6] + "Z"
+    return rendered
+
+
 class EntrySerializer(serializers.ModelSerializer):
     """
     Serializer for the Entry model, used in the API to convert Entry instances
@@ -50,18 +80,14 @@ class EntrySerializer(serializers.ModelSerializer):
         Generate full URL for the API endpoint of the entry
         """
         request = self.context.get("request")
-        return request.build_absolute_uri(
-            reverse("api:entry-detail", args=[obj.id])
-        )
+        return f"{api_url_roots(request)['entries_api']}{obj.id}/"
 
     def get_web(self, obj):
         """
         Generates the URL for the HTML page of the entry
         """
         request = self.context.get("request")
-        return request.build_absolute_uri(
-            reverse("entries:view_entry", args=[obj.id])
-        )
+        return f"{api_url_roots(request)['entries_web']}{obj.id}/"
 
     def get_contentType(self, obj):
         """
@@ -83,35 +109,70 @@ class EntrySerializer(serializers.ModelSerializer):
         Return a paginated likes structure for the entry.
         """
         request = self.context.get("request")
-        likes_qs = obj.liked_by.all()
 
-        page = int(request.query_params.get("like_page", 1)) if request else 1
-        size = int(request.query_params.get("like_size", 50)) if request else 50
+        # Clamped like the view-level pagination so like_size can't force
+        # an unbounded slice; malformed values fall back to the defaults
+        page, size = 1, 50
+        if request:
+            try:
+                page = max(1, int(request.query_params.get("like_page", 1)))
+            except (TypeError, ValueError):
+                pass
+            try:
+                size = min(100, max(1, int(request.query_params.get("like_size", 50))))
+            except (TypeError, ValueError):
+                pass
 
         start = (page - 1) * size
         end = start + size
 
+        # List views prefetch liked_by, so the page and count come from the
+        # cache for free. Without the prefetch (entry detail) the slice runs
+        # as SQL LIMIT/OFFSET and the count reads the view's num_likes
+        # annotation when present rather than issuing another COUNT.
+        if "liked_by" in getattr(obj, "_prefetched_objects_cache", {}):
+            likes = obj.liked_by.all()
+            count = len(likes)
+            likes_page = list(likes[start:end])
+        else:
+            likes_qs = obj.liked_by.all()
+            count = getattr(obj, "num_likes", None)
+            if count is None:
+                count = likes_qs.count()
+            likes_page = list(likes_qs[start:end])
+
         entry_api_url = self.get_id(obj)
         entry_html_url = self.get_web(obj)
 
         likes_url = (
-            request.build_absolute_uri(
-                reverse("api:entry-likes", args=[obj.id])
-            )
+            f"{api_url_roots(request)['entries_api']}{obj.id}/likes/"
             if request
             else ""
         )
 
-        likes_page = likes_qs[start:end]
+        author_cache = None
+        if request is not None:
+            author_cache = getattr(request, "_nested_author_cache", None)
+            if author_cache is None:
+                author_cache = request._nested_author_cache = {}
+
         src = []
         for author in likes_page:
             like_id = f"{likes_url}{author.id}/" if likes_url else ""
+            if author_cache is not None:
+                author_data = author_cache.get(author.id)
+                if author_data is None:
+                    author_data = author_cache[author.id] = AuthorSerializer(
+                        author, context=self.context
+                    ).data
+            else:
+                author_data = AuthorSerializer(
+                    author, context={"request": request}
+                ).data
             src.append(
                 {
                     "type": "like",
-                    "author": AuthorSerializer(
-                        author, context={"request": request}
-                    ).data,
+                    "author": author_data,
                     "published": obj.updated,
                     "id": like_id,
                     "object": entry_html_url,
@@ -124,7 +185,7 @@ class EntrySerializer(serializers.ModelSerializer):
             "id": likes_url,
             "page_number": page,
             "size": size,
-            "count": likes_qs.count(),
+            "count": count,
             "src": src,
         }
     
@@ -134,18 +195,55 @@ class EntrySerializer(serializers.ModelSerializer):
         """
         request = self.context.get("request")
 
-        # All visible comments for this entry
-        comments_qs = obj.comments.select_related("author").order_by("created_at")
-        comments_data = CommentSerializer(
-            comments_qs, many=True, context=self.context
-        ).data
+        # All visible comments for this entry. List views prefetch
+        # comments (with authors) per page; single-entry paths fall back to
+        # one select_related query. Comment.Meta orders by created_at.
+        if "comments" in getattr(obj, "_prefetched_objects_cache", {}):
+            comments_qs = obj.comments.all()
+        else:
+            comments_qs = obj.comments.select_related("author")
+
+        # Nested comments skip CommentSerializer: a page of entries times
+        # comments per entry pays DRF's field machinery O(E*C) times, and
+        # plain dicts built from the prefetched rows produce the same
+        # payload. Standalone comment endpoints still use the serializer.
+        if request is not None:
+            roots = api_url_roots(request)
+            author_cache = getattr(request, "_nested_author_cache", None)
+            if author_cache is None:
+                author_cache = request._nested_author_cache = {}
+            comments_data = []
+            for comment in comments_qs:
+                author = comment.author
+                author_data = author_cache.get(author.id)
+                if author_data is None:
+                    author_data = author_cache[author.id] = AuthorSerializer(
+                        author, context=self.context
+                    ).data
+                num_likes = getattr(comment, "num_likes", None)
+                if num_likes is None:
+                    num_likes = comment.liked_by.count()
+                comments_data.append(
+                    {
+                        "type": "comment",
+                        "id": f"{roots['comments_api']}{comment.id}/",
+                        "entry": f"{roots['entries_api']}{comment.entry_id}/",
+                        "author": author_data,
+                        "comment": comment.content,
+                        "contentType": comment.content_type,
+                        "published": _iso_datetime(comment.created_at),
+                        "likes": num_likes,
+                    }
+                )
+        else:
+            comments_data = CommentSerializer(
+                comments_qs, many=True, context=self.context
+            ).data
 
         # HTML + API URLs
         entry_html_url = self.get_web(obj)
         comments_api_url = (
-            request.build_absolute_uri(
-                reverse("api:entry-comments", args=[obj.id])
-            )
+            f"{api_url_roots(request)['entries_api']}{obj.id}/comments/"
             if request
             else ""
         )
@@ -190,22 +288,23 @@ class CommentSerializer(serializers.ModelSerializer):
     def get_id(self, obj):
         request = self.context.get("request")
         if request:
-            return request.build_absolute_uri(
-                reverse("api:comment-detail", args=[obj.id])
-            )
+            return f"{api_url_roots(request)['comments_api']}{obj.id}/"
         return str(obj.id)
 
     def get_entry(self, obj):
         request = self.context.get("request")
         if request:
-            return request.build_absolute_uri(
-                reverse("api:entry-detail", args=[obj.entry_id])
-            )
+            return f"{api_url_roots(request)['entries_api']}{obj.entry_id}/"
         return str(obj.entry_id)
 
     def get_likes(self, obj):
-        # Assuming Comment model exposes likes_count (as in your views)
-        return obj.likes_count
+        # Views that serialize pages of comments annotate num_likes with a
+        # single GROUP BY instead of one COUNT per comment; fall back to a
+        # direct count for comments fetched without the annotation
+        num_likes = getattr(obj, "num_likes", None)
+        if num_likes is not None:
+            return num_likes
+        return obj.liked_by.count()
 
 class InboxItemSerializer(serializers.Serializer):
     """
@@ -1,20 +1,25 @@
+import functools
+
 from django import template
 from django.utils.safestring import mark_safe
-import commonmark
+import cmarkgfm
 
 register = template.Library()
 
+
+# Identical content (announcements, reposts, repeat page views) skips
+# re-rendering entirely; the cache stores plain str, mark_safe happens below
+@functools.lru_cache(maxsize=1024)
+def _render_markdown_cached(text):
+    return cmarkgfm.github_flavored_markdown_to_html(text)
+
+
 @register.filter(name='render_markdown')
 def render_markdown(text):
     """
-    Converts markdown text to HTML using CommonMark
+    Converts markdown text to HTML using CommonMark (libcmark-gfm)
     """
     if not text:
         return ''
-    
-    parser = commonmark.Parser()
-    renderer = commonmark.HtmlRenderer()
-    ast = parser.parse(text)
-    html = renderer.render(ast)
-    
-    return mark_safe(html)
\ No newline at end of file
+
+    return mark_safe(_render_markdown_cached(text))
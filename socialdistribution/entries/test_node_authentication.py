@@ -1,141 +1,170 @@
-from django.test import TestCase, Client
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase, Client
+from django.test.utils import tag
 from django.contrib.auth import get_user_model
-from rest_framework.test import APITestCase, APIClient
+from rest_framework.test import APITestCase, APIRequestFactory
 from rest_framework import status
 from entries.models import RemoteNode
 from authors.models import Author
+from socialdistribution.authentication import NodeUser
+from socialdistribution.permissions import (
+    IsAuthenticatedNodeOrLocalUser,
+    IsLocalUserOnly,
+)
 import base64
+import functools
 
 User = get_user_model()
 
 
-class RemoteNodeModelTest(TestCase):
-    """Test the RemoteNode model"""
-    
+@functools.lru_cache(maxsize=32)
+def basic_auth(username, password):
+    """Build (and memoize) a Basic Auth header for a credential pair"""
+    credentials = f"{username}:{password}"
+    encoded = base64.b64encode(credentials.encode()).decode()
+    return f"Basic {encoded}"
+
+
+class RemoteNodeModelTest(SimpleTestCase):
+    """Test the RemoteNode model (no database: unsaved instances suffice)"""
+
     def test_create_remote_node(self):
-        """Test creating a remote node with all required fields"""
-        node = RemoteNode.objects.create(
+        """Test constructing a remote node with all required fields"""
+        node = RemoteNode(
             name="Test Node",
             base_url="https://test.example.com/api/",
             username="test_user",
             password="test_pass",
             is_active=True
         )
-        
+
         self.assertEqual(node.name, "Test Node")
         self.assertEqual(node.base_url, "https://test.example.com/api/")
         self.assertEqual(node.username, "test_user")
         self.assertEqual(node.password, "test_pass")
         self.assertTrue(node.is_active)
-        self.assertIsNotNone(node.created_at)
-        self.assertIsNotNone(node.updated_at)
-    
+
     def test_remote_node_str_representation(self):
         """Test the string representation of a remote node"""
-        node = RemoteNode.objects.create(
+        node = RemoteNode(
             name="Alpha Node",
             base_url="https://alpha.example.com/api/",
             username="alpha",
             password="password"
         )
-        
+
         expected_str = "Alpha Node (https://alpha.example.com/api/)"
         self.assertEqual(str(node), expected_str)
-    
+
+    def test_inactive_node(self):
+        """Test constructing an inactive node"""
+        node = RemoteNode(
+            name="Inactive Node",
+            base_url="https://inactive.example.com/api/",
+            username="inactive_user",
+            password="inactive_pass",
+            is_active=False
+        )
+
+        self.assertFalse(node.is_active)
+
+
+class RemoteNodeModelDBTest(TestCase):
+    """RemoteNode behaviour that actually needs the database"""
+
+    @tag("slow", "db-constraint")
     def test_remote_node_unique_constraints(self):
-        """Test that name and base_url must be unique"""
-        RemoteNode.objects.create(
+        """Test that name and base_url must be unique.
+
+        Tagged so inner-loop runs can skip it with --exclude-tag=slow.
+        """
+        node = RemoteNode.objects.create(
             name="Unique Node",
             base_url="https://unique.example.com/api/",
             username="user1",
             password="pass1"
         )
-        
+
+        # Timestamps are only populated on save, so they are checked here
+        # rather than in the no-DB tests above
+        self.assertIsNotNone(node.created_at)
+        self.assertIsNotNone(node.updated_at)
+
+        # Each failed INSERT runs in its own savepoint so the outer test
+        # transaction stays usable afterwards (required on PostgreSQL)
         # Try to create another node with the same name
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             RemoteNode.objects.create(
                 name="Unique Node",  # Same name
                 base_url="https://different.example.com/api/",
                 username="user2",
                 password="pass2"
             )
-        
+
         # Try to create another node with the same base_url
-        with self.assertRaises(Exception):
+        with self.assertRaises(IntegrityError), transaction.atomic():
             RemoteNode.objects.create(
                 name="Different Node",
                 base_url="https://unique.example.com/api/",  # Same URL
                 username="user3",
                 password="pass3"
             )
-    
-    def test_inactive_node(self):
-        """Test creating an inactive node"""
-        node = RemoteNode.objects.create(
-            name="Inactive Node",
-            base_url="https://inactive.example.com/api/",
-            username="inactive_user",
-            password="inactive_pass",
-            is_active=False
-        )
-        
-        self.assertFalse(node.is_active)
 
 
 class RemoteNodeBasicAuthenticationTest(APITestCase):
     """Test HTTP Basic Authentication for remote nodes"""
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = APIClient()
-        
-        # Create an active remote node
-        self.active_node = RemoteNode.objects.create(
-            name="Active Node",
-            base_url="https://active.example.com/api/",
-            username="active_user",
-            password="active_pass",
-            is_active=True
-        )
-        
-        # Create an inactive remote node
-        self.inactive_node = RemoteNode.objects.create(
-            name="Inactive Node",
-            base_url="https://inactive.example.com/api/",
-            username="inactive_user",
-            password="inactive_pass",
-            is_active=False
-        )
-        
-        # Create a local user for testing
-        self.local_user = User.objects.create_user(
-            username="localuser",
-            password="localpass"
-        )
-        
-        # Create some test authors
-        self.author1 = Author.objects.create(
-            username="author1",
-            display_name="Author One",
-            is_active=True,
-            is_approved=True
-        )
-        self.author2 = Author.objects.create(
-            username="author2",
-            display_name="Author Two",
-            is_active=True,
-            is_approved=True
-        )
-    
-    def get_basic_auth_header(self, username, password):
-        """Helper method to create Basic Auth header"""
-        credentials = f"{username}:{password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded}"
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class; each test rolls back to them"""
+        # One multi-VALUES INSERT for both nodes instead of two round trips
+        cls.active_node, cls.inactive_node = RemoteNode.objects.bulk_create([
+            RemoteNode(
+                name="Active Node",
+                base_url="https://active.example.com/api/",
+                username="active_user",
+                password="active_pass",
+                is_active=True
+            ),
+            RemoteNode(
+                name="Inactive Node",
+                base_url="https://inactive.example.com/api/",
+                username="inactive_user",
+                password="inactive_pass",
+                is_active=False
+            ),
+        ])
+        
+        # Create a local user for testing. Tests only force_authenticate
+        # as this user, so no password hash is ever checked
+        cls.local_user = User(username="localuser")
+        cls.local_user.set_unusable_password()
+        cls.local_user.save()
+        
+        # Create some test authors, batched the same way
+        cls.author1, cls.author2 = Author.objects.bulk_create([
+            Author(
+                username="author1",
+                display_name="Author One",
+                is_active=True,
+                is_approved=True
+            ),
+            Author(
+                username="author2",
+                display_name="Author Two",
+                is_active=True,
+                is_approved=True
+            ),
+        ])
+
+        # Auth headers for fixed credentials are constants; build them once
+        cls.active_auth = basic_auth("active_user", "active_pass")
+        cls.inactive_auth = basic_auth("inactive_user", "inactive_pass")
+
     
     def test_access_authors_list_with_valid_node_credentials(self):
         """Test that a remote node can access authors list with valid credentials"""
-        auth_header = self.get_basic_auth_header("active_user", "active_pass")
+        auth_header = self.active_auth
         
         response = self.client.get(
             '/api/authors/',
@@ -149,7 +178,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_access_authors_list_with_invalid_credentials(self):
         """Test that invalid credentials are rejected"""
-        auth_header = self.get_basic_auth_header("wrong_user", "wrong_pass")
+        auth_header = basic_auth("wrong_user", "wrong_pass")
         
         response = self.client.get(
             '/api/authors/',
@@ -160,7 +189,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_access_authors_list_with_inactive_node(self):
         """Test that an inactive node cannot access the API"""
-        auth_header = self.get_basic_auth_header("inactive_user", "inactive_pass")
+        auth_header = self.inactive_auth
         
         response = self.client.get(
             '/api/authors/',
@@ -177,7 +206,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_access_author_detail_with_valid_node_credentials(self):
         """Test that a remote node can access author details"""
-        auth_header = self.get_basic_auth_header("active_user", "active_pass")
+        auth_header = self.active_auth
         
         response = self.client.get(
             f'/api/authors/{self.author1.id}/',
@@ -198,7 +227,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_node_cannot_access_local_only_endpoints(self):
         """Test that remote nodes cannot access local-only endpoints"""
-        auth_header = self.get_basic_auth_header("active_user", "active_pass")
+        auth_header = self.active_auth
         
         # Try to access explore endpoint (local only)
         response = self.client.get(
@@ -219,7 +248,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_wrong_password_for_valid_username(self):
         """Test that correct username with wrong password fails"""
-        auth_header = self.get_basic_auth_header("active_user", "wrong_password")
+        auth_header = basic_auth("active_user", "wrong_password")
         
         response = self.client.get(
             '/api/authors/',
@@ -230,7 +259,7 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
     
     def test_case_sensitive_credentials(self):
         """Test that credentials are case-sensitive"""
-        auth_header = self.get_basic_auth_header("ACTIVE_USER", "active_pass")
+        auth_header = basic_auth("ACTIVE_USER", "active_pass")
         
         response = self.client.get(
             '/api/authors/',
@@ -241,13 +270,17 @@ class RemoteNodeBasicAuthenticationTest(APITestCase):
 
 
 class RemoteNodePermissionsTest(APITestCase):
-    """Test permission classes for node authentication"""
+    """Test permission classes for node authentication.
+
+    These exercise has_permission() directly on factory requests instead
+    of driving full view cycles: routing, the queryset and serialization
+    are irrelevant to the boolean under test.
+    """
     
-    def setUp(self):
-        """Set up test data"""
-        self.client = APIClient()
-        
-        self.node = RemoteNode.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Create shared fixtures once per class"""
+        cls.node = RemoteNode.objects.create(
             name="Test Node",
             base_url="https://test.example.com/api/",
             username="node_user",
@@ -255,55 +288,45 @@ class RemoteNodePermissionsTest(APITestCase):
             is_active=True
         )
         
-        self.local_user = User.objects.create_user(
-            username="testuser",
-            password="testpass"
-        )
-    
-    def get_basic_auth_header(self, username, password):
-        """Helper method to create Basic Auth header"""
-        credentials = f"{username}:{password}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        return f"Basic {encoded}"
+        # No login; requests get the user assigned directly
+        cls.local_user = User(username="testuser")
+        cls.local_user.set_unusable_password()
+        cls.local_user.save()
+
+    # Stateless and shared by every test
+    factory = APIRequestFactory()
+
+    def _node_request(self):
+        """Factory request authenticated as the remote node"""
+        request = self.factory.get('/api/authors/')
+        request.user = NodeUser(self.node)
+        return request
+
+    def _local_request(self):
+        """Factory request authenticated as a local user"""
+        request = self.factory.get('/api/authors/')
+        request.user = self.local_user
+        return request
     
     def test_is_authenticated_node_or_local_user_with_node(self):
         """Test IsAuthenticatedNodeOrLocalUser allows nodes"""
-        auth_header = self.get_basic_auth_header("node_user", "node_pass")
-        
-        response = self.client.get(
-            '/api/authors/',
-            HTTP_AUTHORIZATION=auth_header
-        )
-        
-        self.assertNotEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        permission = IsAuthenticatedNodeOrLocalUser()
+        self.assertTrue(permission.has_permission(self._node_request(), None))
     
     def test_is_authenticated_node_or_local_user_with_local_user(self):
         """Test IsAuthenticatedNodeOrLocalUser allows local users"""
-        self.client.force_authenticate(user=self.local_user)
-        
-        response = self.client.get('/api/authors/')
-        
-        self.assertNotEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        permission = IsAuthenticatedNodeOrLocalUser()
+        self.assertTrue(permission.has_permission(self._local_request(), None))
     
     def test_is_local_user_only_blocks_nodes(self):
         """Test IsLocalUserOnly blocks nodes"""
-        auth_header = self.get_basic_auth_header("node_user", "node_pass")
-        
-        response = self.client.get(
-            '/api/authors/explore/',
-            HTTP_AUTHORIZATION=auth_header
-        )
-        
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        permission = IsLocalUserOnly()
+        self.assertFalse(permission.has_permission(self._node_request(), None))
     
     def test_is_local_user_only_allows_local_users(self):
         """Test IsLocalUserOnly allows local users"""
-        self.client.force_authenticate(user=self.local_user)
-        
-        response = self.client.get('/api/authors/explore/')
-        
-        # Should not be forbidden (might be 404 if endpoint doesn't exist)
-        self.assertNotEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        permission = IsLocalUserOnly()
+        self.assertTrue(permission.has_permission(self._local_request(), None))
 
 
 class AddRemoteNodeCommandTest(TestCase):
@@ -336,7 +359,9 @@ class AddRemoteNodeCommandTest(TestCase):
     
     def test_command_updates_existing_node(self):
         """Test that the command updates an existing node"""
-        from django.core.management import call_command
+        # Calling handle() directly skips call_command's argparse setup;
+        # the create test above still covers the argument wiring
+        from entries.management.commands.add_remote_node import Command
         from io import StringIO
         
         # Create initial node
@@ -348,13 +373,12 @@ class AddRemoteNodeCommandTest(TestCase):
         )
         
         out = StringIO()
-        call_command(
-            'add_remote_node',
-            'New Name',
-            'https://update.example.com/api/',
-            'new_user',
-            'new_pass',
-            stdout=out
+        Command(stdout=out).handle(
+            name='New Name',
+            base_url='https://update.example.com/api/',
+            username='new_user',
+            password='new_pass',
+            inactive=False
         )
         
         # Check that node was updated
@@ -367,16 +391,16 @@ class AddRemoteNodeCommandTest(TestCase):
         self.assertIn('Successfully updated', out.getvalue())
     
     def test_command_creates_inactive_node(self):
-        """Test that the --inactive flag creates an inactive node"""
-        from django.core.management import call_command
+        """Test that the inactive flag creates an inactive node"""
+        from entries.management.commands.add_remote_node import Command
+        from io import StringIO
         
-        call_command(
-            'add_remote_node',
-            'Inactive Command Node',
-            'https://inactive-cmd.example.com/api/',
-            'inactive_user',
-            'inactive_pass',
-            '--inactive'
+        Command(stdout=StringIO()).handle(
+            name='Inactive Command Node',
+            base_url='https://inactive-cmd.example.com/api/',
+            username='inactive_user',
+            password='inactive_pass',
+            inactive=True
         )
         
         node = RemoteNode.objects.get(base_url='https://inactive-cmd.example.com/api/')
@@ -386,22 +410,28 @@ class AddRemoteNodeCommandTest(TestCase):
 class NodeAdminTest(TestCase):
     """Test the RemoteNode admin interface"""
     
-    def setUp(self):
-        """Set up admin user and client"""
-        self.admin_user = User.objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """Create the admin user and node once per class"""
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@test.com',
             password='adminpass'
         )
-        self.client = Client()
-        self.client.login(username='admin', password='adminpass')
         
-        self.node = RemoteNode.objects.create(
+        cls.node = RemoteNode.objects.create(
             name="Admin Test Node",
             base_url="https://admin-test.example.com/api/",
             username="admin_node_user",
             password="admin_node_pass"
         )
+
+    def setUp(self):
+        """Per-test client and session (session state is per-test)"""
+        self.client = Client()
+        # force_login installs the session directly, skipping the
+        # authenticate() password check each test
+        self.client.force_login(self.admin_user)
     
     def test_admin_can_view_remote_nodes(self):
         """Test that admin can view the remote nodes list"""
@@ -328,6 +328,67 @@ class EntryAPITests(TestCase):
         response = self.client.get(f'/api/entries/{self.friends_entry.id}/')
         # Expect a 404 Not Found
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_entry_detail_rejects_writes(self):
+        """
+        Test: The read-only entry detail endpoint refuses PUT/DELETE;
+        writes must go through /api/entries/<entry_id>/edit/
+        API: PUT/DELETE /api/entries/<entry_id>/
+        """
+        url = f'/api/entries/{self.public_entry.id}/'
+
+        response = self.client.put(
+            url, {"title": "hijacked"}, content_type="application/json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        response = self.client.delete(url)
+        self.assertEqual(response.status_code, status.HTTP_405_METHOD_NOT_ALLOWED)
+
+        self.public_entry.refresh_from_db()
+        self.assertEqual(self.public_entry.title, "Public")
+
+    def test_get_entry_conditional_request_returns_304(self):
+        """
+        Test: Re-requesting an entry with its ETag should return 304 Not Modified
+        API: GET /api/entries/<entry_id>/ with If-None-Match
+        """
+        first = self.client.get(f'/api/entries/{self.public_entry.id}/')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first.headers['ETag']
+
+        second = self.client.get(
+            f'/api/entries/{self.public_entry.id}/',
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(second.headers['ETag'], etag)
+
+    def test_get_entry_list_conditional_request_returns_304(self):
+        """
+        Test: The public entries list honours If-None-Match and the ETag
+        changes when an entry is added
+        API: GET /api/entries/ with If-None-Match
+        """
+        first = self.client.get('/api/entries/')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        etag = first.headers['ETag']
+
+        second = self.client.get('/api/entries/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # A new public entry must invalidate the stored validator
+        Entry.objects.create(
+            author=self.author,
+            title="Fresh",
+            description="",
+            content="new content",
+            content_type="text/plain",
+            visibility="PUBLIC",
+        )
+        third = self.client.get('/api/entries/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(third.status_code, status.HTTP_200_OK)
+
     def test_get_entry_list(self):
         """
         Test: List all public entries
@@ -901,6 +962,48 @@ class EntryLikesAPITests(TestCase):
         liker_ids = {item.get("author", {}).get("id") for item in response.data["items"]}
         self.assertIn(str(self.viewer.id), liker_ids)
 
+    def test_like_listing_cursor_pagination(self):
+        self.public_entry.liked_by.add(self.author, self.viewer, self.friend)
+
+        first = self.client.get(
+            f"/api/entries/{self.public_entry.id}/likes/",
+            {"cursor": "", "size": 2},
+        )
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first.data.get("type"), "likes")
+        self.assertEqual(first.data.get("size"), 2)
+        self.assertEqual(len(first.data["items"]), 2)
+        cursor = first.data.get("next_cursor")
+        self.assertIsNotNone(cursor)
+
+        second = self.client.get(
+            f"/api/entries/{self.public_entry.id}/likes/",
+            {"cursor": cursor, "size": 2},
+        )
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(second.data["items"]), 1)
+        self.assertIsNone(second.data.get("next_cursor"))
+
+        # Both pages together cover each liker exactly once
+        liker_ids = [
+            item.get("author", {}).get("id")
+            for item in first.data["items"] + second.data["items"]
+        ]
+        self.assertEqual(len(liker_ids), len(set(liker_ids)))
+        self.assertEqual(
+            set(liker_ids),
+            {str(self.author.id), str(self.viewer.id), str(self.friend.id)},
+        )
+
+    def test_like_listing_rejects_malformed_cursor(self):
+        self.public_entry.liked_by.add(self.viewer)
+
+        response = self.client.get(
+            f"/api/entries/{self.public_entry.id}/likes/",
+            {"cursor": "not-a-uuid"},
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_cannot_like_friends_entry_without_mutual_follow(self):
         self.client.force_authenticate(user=self.viewer)
         response = self.client.post(f"/api/entries/{self.friends_entry.id}/like/")
@@ -1,8 +1,12 @@
+import logging
+
 from rest_framework import authentication
 from rest_framework import exceptions
 from entries.models import RemoteNode
 from django.conf import settings
 
+logger = logging.getLogger(__name__)
+
 
 class RemoteNodeBasicAuthentication(authentication.BasicAuthentication):
     """
@@ -17,9 +21,7 @@ class RemoteNodeBasicAuthentication(authentication.BasicAuthentication):
         Authenticate the userid and password against RemoteNode entries
         OR universal credentials.
         """
-        print(f"[AUTH] Incoming auth attempt:")
-        print(f"[AUTH] Received userid: {userid}")
-        print(f"[AUTH] Received password: {password}")
+        logger.debug("[AUTH] Incoming auth attempt for userid=%s", userid)
 
         # First, try to match against per-node credentials in database
         try:
@@ -28,31 +30,35 @@ class RemoteNodeBasicAuthentication(authentication.BasicAuthentication):
                 password=password,
                 is_active=True
             )
-            print(f"[AUTH] Match found in RemoteNode DB: {node.base_url}")
+            logger.debug("[AUTH] Match found in RemoteNode DB: %s", node.base_url)
             return (NodeUser(node), None)
         except RemoteNode.DoesNotExist:
-            print(f"[AUTH] No match in RemoteNode DB, trying universal credentials...")
+            logger.debug("[AUTH] No match in RemoteNode DB, trying universal credentials")
 
         # Second, try universal credentials from settings
         universal_user = getattr(settings, 'OUR_NODE_USERNAME', None)
         universal_pass = getattr(settings, 'OUR_NODE_PASSWORD', None)
         
         if universal_user and universal_pass:
-            print(f"[AUTH] Universal credentials: {universal_user}:{universal_pass}")
             if userid == universal_user and password == universal_pass:
-                print(f"[AUTH] Match found using universal credentials!")
+                logger.debug("[AUTH] Match found using universal credentials")
                 return (NodeUser(None), None)
-            else:
-                print(f"[AUTH] Universal credentials did not match")
+            logger.debug("[AUTH] Universal credentials did not match")
         else:
-            print(f"[AUTH] No universal credentials configured in settings")
+            logger.debug("[AUTH] No universal credentials configured in settings")
+
+        # Only enumerate the configured nodes (an extra query) when debug
+        # logging is actually on; never log stored passwords
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "[AUTH] Authentication FAILED; active node usernames: %s",
+                list(
+                    RemoteNode.objects.filter(is_active=True).values_list(
+                        "username", flat=True
+                    )
+                ),
+            )
 
-        # Neither matched - log all options for debugging
-        print(f"[AUTH] Authentication FAILED")
-        print(f"[AUTH] Active RemoteNodes in database:")
-        for n in RemoteNode.objects.filter(is_active=True):
-            print(f"[AUTH]   - {n.base_url}: {n.username}:{n.password}")
-        
         raise exceptions.AuthenticationFailed('Invalid node credentials')
 
 
@@ -1,4 +1,5 @@
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
 """
 From the prompt: "how do you allow customization of page size in query params Django ex url/someth?page=5&page_size =3"
 ChatGPT 4.5, OpenAI, 2025/10/16,https://chatgpt.com/c/68f281b5-b4a0-8330-856d-c05eac523956
@@ -8,4 +9,23 @@ Class to allow for custom page_size params from API endpoints
 class CustomPageNumberPagination(PageNumberPagination):
     page_size = 10  # default
     page_size_query_param = 'page_size'  # customizable page size
-    max_page_size = 100  # page size limit
\ No newline at end of file
+    max_page_size = 100  # page size limit
+
+
+class AuthorCursorPagination(CursorPagination):
+    """
+    Keyset pagination for the authors list: each page is an indexed range
+    scan on id instead of the LIMIT/OFFSET scan-and-discard that page
+    numbers cost on deep pages. Keeps the spec's {"type": "authors"}
+    envelope with next/previous cursor links alongside.
+    """
+    ordering = 'id'
+    page_size = 100
+
+    def get_paginated_response(self, data):
+        return Response({
+            'type': 'authors',
+            'authors': data,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+        })
\ No newline at end of file
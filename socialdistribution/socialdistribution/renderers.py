@@ -0,0 +1,19 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Drop-in JSON renderer backed by orjson, which serializes the large
+    author/entry list responses several times faster than stdlib json
+    and handles UUID/datetime values natively.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # OPT_UTC_Z keeps raw datetimes on the wire as Z-suffixed UTC,
+        # matching what DRF's serializer fields emit
+        return orjson.dumps(
+            data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        )
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 import dj_database_url
 
@@ -92,6 +93,22 @@ else:
         }
     }
 
+# Cache: Redis when REDIS_URL is set (Heroku), local memory otherwise.
+# Used for short-TTL caching of remote node responses (explore page).
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -116,6 +133,14 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Tests: shard across worker processes by default (see the runner docstring)
+TEST_RUNNER = 'socialdistribution.test_runner.ParallelDiscoverRunner'
+
+# Tests don't need PBKDF2's deliberately slow iteration count; MD5 makes
+# every set_password/check_password in fixtures and signup tests ~free
+if 'test' in sys.argv:
+    PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 # Primary key
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -136,6 +161,10 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'socialdistribution.renderers.ORJSONRenderer',  # orjson-backed JSON for hot list endpoints
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
     'DEFAULT_PAGINATION_CLASS': 'socialdistribution.pagination.CustomPageNumberPagination',
     'PAGE_SIZE': 10,
 
@@ -170,6 +199,9 @@ SPECTACULAR_SETTINGS = {
 # Cron
 CRONJOBS = [
     ('*/60 * * * *', 'django.core.management.call_command', ['sync_github']),
+    # Keeps the explore endpoint's remote-author snapshot warm so requests
+    # never fan out to remote nodes themselves
+    ('* * * * *', 'django.core.management.call_command', ['refresh_explore_snapshot']),
 ]
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
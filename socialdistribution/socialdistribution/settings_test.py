@@ -0,0 +1,65 @@
+"""
+Test-only settings overrides.
+
+`python manage.py test` already swaps in the MD5 hasher via the sys.argv
+check in settings.py; this module covers entry points that don't go
+through manage.py (CI runners, IDE test launchers) invoked with
+--settings=socialdistribution.settings_test or
+DJANGO_SETTINGS_MODULE=socialdistribution.settings_test.
+
+PBKDF2 runs hundreds of thousands of SHA-256 rounds per password, which
+dominates setUp time for suites that create users and log in; MD5 makes
+each of those a single hash call. SQLite test databases are created in
+memory by Django automatically, so nothing else needs overriding.
+"""
+import logging
+
+from .settings import *  # noqa: F401,F403
+
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Tests assert on status codes and payloads, not log output
+LOGGING_CONFIG = None
+logging.disable(logging.CRITICAL)
+
+
+class DisableMigrations:
+    """Pretend every app has no migrations.
+
+    Django then creates test tables straight from the current models
+    instead of replaying the whole migration history per run (and per
+    parallel worker). Data migrations only backfill existing rows, so an
+    empty test database loses nothing.
+    """
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+# Static file serving and CSRF enforcement are irrelevant under the test
+# client (it opts out of CSRF checks); the session/auth/messages stack
+# stays because the admin tests exercise it.
+MIDDLEWARE = [
+    m for m in MIDDLEWARE  # noqa: F405
+    if m not in (
+        "whitenoise.middleware.WhiteNoiseMiddleware",
+        "django.middleware.csrf.CsrfViewMiddleware",
+    )
+]
+
+# Always test against SQLite, even when DATABASE_URL points at Postgres:
+# the suite is "create a few rows, hit a view" and shouldn't pay network
+# or fsync costs. Django creates SQLite test databases in memory (one per
+# --parallel worker), so durability pragmas are moot — there is no disk.
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": BASE_DIR / "db.sqlite3",  # noqa: F405
+        "TEST": {"NAME": ":memory:"},
+    }
+}
@@ -0,0 +1,18 @@
+import multiprocessing
+
+from django.test.runner import DiscoverRunner
+
+
+class ParallelDiscoverRunner(DiscoverRunner):
+    """
+    DiscoverRunner that runs test classes in parallel worker processes by
+    default. The suite is dominated by per-test DB setup rather than CPU,
+    and the tests share no state beyond the test database (which each
+    worker gets its own clone of), so sharding them is safe. An explicit
+    --parallel flag still wins; a couple of cores are left as headroom.
+    """
+
+    def __init__(self, parallel=0, **kwargs):
+        if not parallel:
+            parallel = max(multiprocessing.cpu_count() - 2, 1)
+        super().__init__(parallel=parallel, **kwargs)